@@ -13,6 +13,14 @@ import tcod.path
 import tcod.ecs
 from typing import Dict, List, Tuple, Optional
 from engine.ecs.components import Position, EntityIdentity, Disposition, Stress, CombatVitals
+from engine.ecs.spatial import PositionBuffer
+
+# Above this many seeds the (seeds x H x W) broadcast costs more memory than Dijkstra saves
+BROADCAST_SEED_LIMIT = 64
+
+def _reputation_or_nan(entity: tcod.ecs.Entity) -> float:
+    disp = entity.components.get(Disposition)
+    return disp.reputation if disp is not None else np.nan
 
 class InfluenceMapSystem:
     """
@@ -35,8 +43,12 @@ class InfluenceMapSystem:
         # We'll just store the global coords and map them during update
         self._manual_affinity_seeds.append((global_y, global_x))
 
-    def update(self, registry: tcod.ecs.Registry, center_x: int, center_y: int, viewer: Optional[tcod.ecs.Entity] = None):
-        """Recomputes all global layers based on current entity positions and states."""
+    def update(self, registry: tcod.ecs.Registry, center_x: int, center_y: int, viewer: Optional[tcod.ecs.Entity] = None,
+               positions: Optional[PositionBuffer] = None):
+        """
+        Recomputes all global layers based on current entity positions and states.
+        Pass a shared PositionBuffer when calling once per viewer in the same tick.
+        """
         self.off_x = center_x - self.width // 2
         self.off_y = center_y - self.height // 2
 
@@ -51,23 +63,19 @@ class InfluenceMapSystem:
                 affinity_seeds.append((ly, lx))
         self._manual_affinity_seeds.clear() # Clear for next cycle
         
-        for entity in registry.Q.all_of(components=[Position]):
-            if entity == viewer:
-                continue
-                
-            pos = entity.components[Position]
-            lx, ly = pos.x - self.off_x, pos.y - self.off_y
-            
-            if not (0 <= lx < self.width and 0 <= ly < self.height):
-                continue
-                
-            # Social seeds
-            if Disposition in entity.components:
-                disp = entity.components[Disposition]
-                if disp.reputation < -0.3:
-                    threat_seeds.append((ly, lx)) # NumPy uses (y, x)
-                elif disp.reputation > 0.4:
-                    affinity_seeds.append((ly, lx))
+        if positions is None:
+            positions = PositionBuffer.from_registry(registry)
+        
+        # Social seeds: in-view entities (other than the viewer) by Disposition
+        mask = positions.in_rect(self.off_x, self.off_y, self.width, self.height)
+        viewer_idx = positions.index_of(viewer) if viewer is not None else None
+        if viewer_idx is not None:
+            mask[viewer_idx] = False
+        rep = positions.column("reputation", _reputation_or_nan) # NaN = no Disposition
+        ly = positions.ys - self.off_y
+        lx = positions.xs - self.off_x
+        for seeds, sel in ((threat_seeds, mask & (rep < -0.3)), (affinity_seeds, mask & (rep > 0.4))):
+            seeds.extend(zip(ly[sel].tolist(), lx[sel].tolist())) # NumPy uses (y, x)
 
         # 2. Compute Dijkstra Layers
         self.threat_map = self._compute_normalized_dijkstra(threat_seeds)
@@ -85,16 +93,25 @@ class InfluenceMapSystem:
         if not seeds:
             return np.ones((self.height, self.width), dtype=np.float32)
             
-        # Set seed points to 0
-        for y, x in seeds:
-            if 0 <= y < self.height and 0 <= x < self.width:
-                dist[y, x] = 0
-            
-        # Cost map: uniform cost for now (1)
-        cost = np.ones((self.height, self.width), dtype=np.int32)
-        
-        # Compute Dijkstra
-        tcod.path.dijkstra2d(dist, cost, cardinal=1, diagonal=1, out=dist)
+        ys, xs = np.asarray(seeds, dtype=np.intp).T
+        inb = (ys >= 0) & (ys < self.height) & (xs >= 0) & (xs < self.width)
+        ys, xs = ys[inb], xs[inb]
+
+        if 0 < len(ys) <= BROADCAST_SEED_LIMIT:
+            # Uniform cost with diagonal=1 on an open grid: the Dijkstra distance is the
+            # Chebyshev distance to the nearest seed, computed in one broadcast
+            dy = np.abs(np.arange(self.height)[None, :] - ys[:, None])
+            dx = np.abs(np.arange(self.width)[None, :] - xs[:, None])
+            dist = np.maximum(dy[:, :, None], dx[:, None, :]).min(axis=0).astype(np.int32)
+        else:
+            # Set seed points to 0
+            dist[ys, xs] = 0
+
+            # Cost map: uniform cost for now (1); read-only, so built once per map size
+            cost = self._uniform_cost()
+
+            # Compute Dijkstra
+            tcod.path.dijkstra2d(dist, cost, cardinal=1, diagonal=1, out=dist)
         
         # Normalize
         reachable = dist < 1000000
@@ -110,6 +127,12 @@ class InfluenceMapSystem:
         normalized = dist.astype(np.float32) / max_val
         return normalized
 
+    def _uniform_cost(self) -> np.ndarray:
+        cost = getattr(self, "_cost", None)
+        if cost is None or cost.shape != (self.height, self.width):
+            cost = self._cost = np.ones((self.height, self.width), dtype=np.int32)
+        return cost
+
     def get_value(self, layer: str, global_x: int, global_y: int) -> float:
         """Helper to sample a layer at global coordinates."""
         lx, ly = global_x - self.off_x, global_y - self.off_y
@@ -131,3 +154,22 @@ class InfluenceMapSystem:
         u_desire = (1.0 - self.urgency_map) * profile.urgency_weight
         
         return t_desire + a_desire + u_desire
+
+    def get_desire_window(self, profile: BehaviorProfile, global_x: int, global_y: int, radius: int = 1) -> np.ndarray:
+        """
+        Same values as get_desire_map, but only for the (2r+1)^2 square centred on a
+        global point. Off-map cells are -inf.
+        """
+        size = 2 * radius + 1
+        out = np.full((size, size), -np.inf, dtype=np.float64)
+        lx, ly = global_x - self.off_x - radius, global_y - self.off_y - radius
+        x0, y0 = max(lx, 0), max(ly, 0)
+        x1, y1 = min(lx + size, self.width), min(ly + size, self.height)
+        if x0 < x1 and y0 < y1:
+            sl = (slice(y0, y1), slice(x0, x1))
+            out[y0 - ly:y1 - ly, x0 - lx:x1 - lx] = (
+                (1.0 - self.threat_map[sl]) * profile.threat_weight
+                + (1.0 - self.affinity_map[sl]) * profile.affinity_weight
+                + (1.0 - self.urgency_map[sl]) * profile.urgency_weight
+            )
+        return out
@@ -48,15 +48,20 @@ Design Variables (must not be hardcoded elsewhere)
   CHRONICLE_SIGNIFICANCE_MIN       2    — minimum significance to inscribe
   CHRONICLE_CONFIDENCE_WITNESSED   0.9  — default confidence when player present
   CHRONICLE_CONFIDENCE_FABRICATED  0.4  — default confidence when player absent
+  CHRONICLE_ASYNC_QUEUE_SIZE       4096 — pending writes before emitters block (async mode)
 """
 
 from __future__ import annotations
 
 import json
+import queue
+import sys
+import threading
 import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, TextIO
 
 from engine.combat import (
     CombatEvent,
@@ -82,6 +87,7 @@ from engine.combat import (
 CHRONICLE_SIGNIFICANCE_MIN: int = 2
 CHRONICLE_CONFIDENCE_WITNESSED: float = 0.9
 CHRONICLE_CONFIDENCE_FABRICATED: float = 0.4
+CHRONICLE_ASYNC_QUEUE_SIZE: int = 4096   # pending writes before emitters block (mode="async")
 
 
 # ============================================================
@@ -388,6 +394,9 @@ class ChronicleInscriber:
         # run encounter
         inscriber.close_session()
 
+    Pass chronicle_stream (e.g. io.StringIO) instead of a path to keep
+    entries off the filesystem; used by unit tests.
+
     Hard Limits:
         #2  — entries are frozen (ChronicleEntry is frozen=True dataclass)
         #11 — bus is injected; no global singleton
@@ -396,23 +405,37 @@ class ChronicleInscriber:
     def __init__(
         self,
         bus: EventBus,
-        chronicle_path: Path,
+        chronicle_path: Optional[Path],
         clock: GameTimestamp,
         player_present: bool = True,
         significance_min: int = CHRONICLE_SIGNIFICANCE_MIN,
         confidence_witnessed: float = CHRONICLE_CONFIDENCE_WITNESSED,
         confidence_fabricated: float = CHRONICLE_CONFIDENCE_FABRICATED,
+        chronicle_stream: Optional[TextIO] = None,
+        mode: str = "sync",
     ) -> None:
+        if chronicle_path is None and chronicle_stream is None:
+            raise ValueError("ChronicleInscriber needs a chronicle_path or chronicle_stream")
+        if mode not in ("sync", "async"):
+            raise ValueError(f"Unknown chronicle mode {mode!r} (expected 'sync' or 'async')")
         self.bus = bus
         self.chronicle_path = chronicle_path
+        self.chronicle_stream = chronicle_stream
         self.clock = clock
         self.player_present = player_present
         self.significance_min = significance_min
         self.confidence_witnessed = confidence_witnessed
         self.confidence_fabricated = confidence_fabricated
+        # Pending JSONL lines while inside buffered(); None = write through
+        self._buffer: Optional[List[str]] = None
+        # mode="async": a writer thread drains _queue; flush()/close_session() wait for it
+        self.mode = mode
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=CHRONICLE_ASYNC_QUEUE_SIZE)
+        self._writer: Optional[threading.Thread] = None
 
         # Ensure parent directory exists
-        self.chronicle_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.chronicle_stream is None:
+            self.chronicle_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Subscribe as wildcard receiver — always last registered
         bus.subscribe("*", self._on_event)
@@ -444,6 +467,18 @@ class ChronicleInscriber:
             data={"clock": self.clock.to_dict()},
         )
         self._inscribe(marker, significance=5, bypass_gate=True)
+        self.flush()
+
+    def flush(self) -> None:
+        """
+        Block until every queued async write has reached the file.
+        No-op in sync mode. The writer thread restarts on the next write.
+        """
+        if self._writer is None:
+            return
+        self._queue.put(None)
+        self._writer.join()
+        self._writer = None
 
     def advance_clock(self, ticks: int = 1) -> None:
         """Advance the injected clock by N ticks in place."""
@@ -457,6 +492,22 @@ class ChronicleInscriber:
         """
         self.player_present = present
 
+    @contextmanager
+    def buffered(self) -> Iterator[None]:
+        """
+        Hold inscribed lines in memory and write them in a single call when
+        the block exits. Nested blocks join the outermost one.
+        """
+        if self._buffer is not None:
+            yield
+            return
+        self._buffer = []
+        try:
+            yield
+        finally:
+            lines, self._buffer = self._buffer, None
+            self._write_lines(lines)
+
     # ----------------------------------------------------------
     # Internal: wildcard subscriber
     # ----------------------------------------------------------
@@ -515,8 +566,44 @@ class ChronicleInscriber:
         File is opened in append mode; never truncated.
         Hard Limit #2: entries are never modified after write.
         """
+        line = json.dumps(entry.to_dict(), ensure_ascii=False) + "\n"
+        if self._buffer is not None:
+            self._buffer.append(line)
+            return
+        self._write_lines([line])
+
+    def _write_lines(self, lines: List[str]) -> None:
+        if not lines:
+            return
+        data = "".join(lines)
+        if self.mode == "async":
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._drain_queue, name="chronicle-writer", daemon=True
+                )
+                self._writer.start()
+            self._queue.put(data)
+            return
+        self._write_now(data)
+
+    def _drain_queue(self) -> None:
+        """Writer-thread loop; None is the flush sentinel."""
+        while True:
+            data = self._queue.get()
+            if data is None:
+                return
+            try:
+                self._write_now(data)
+            except Exception as exc:  # noqa: BLE001
+                # Keep draining so emitters never block on a dead writer
+                print(f"[Chronicle] Async write failed: {exc}", file=sys.stderr)
+
+    def _write_now(self, data: str) -> None:
+        if self.chronicle_stream is not None:
+            self.chronicle_stream.write(data)
+            return
         with open(self.chronicle_path, "a", encoding="utf-8") as fh:
-            fh.write(json.dumps(entry.to_dict(), ensure_ascii=False) + "\n")
+            fh.write(data)
 
 
 # ============================================================
@@ -49,10 +49,11 @@ from __future__ import annotations
 
 import random
 import sys
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
-from typing import Callable, Dict, List, Optional, Any, Type, TypeVar
+from typing import Callable, Deque, Dict, List, Optional, Any, Tuple, Type, TypeVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 # ============================================================
 # DESIGN VARIABLE DEFAULTS
@@ -107,7 +108,8 @@ class CombatEvent(BaseModel):
     event_key: str
     source: str
     target: Optional[str] = None
-    data: Dict[str, Any] = {}
+    # default_factory skips pydantic's per-instance copy of a literal {} default
+    data: Dict[str, Any] = Field(default_factory=dict)
 
 
 # ============================================================
@@ -125,25 +127,38 @@ class EventBus:
     Wildcard key "*" receives every emitted event (used by Chronicle).
     Per-handler errors are swallowed and logged to stderr so emission
     always continues (daemon protection principle).
+
+    emit_deferred() queues an event instead of dispatching it inside the
+    current handler chain; the bus owner calls drain() (SimulationLoop does
+    so at the end of every tick and on close_session).
     """
 
     def __init__(self) -> None:
         self._subscribers: Dict[str, List[HandlerFn]] = {}
+        # event_key -> (specific handlers..., wildcard handlers...)
+        # Built lazily on emit; cleared whenever subscriptions change.
+        self._dispatch: Dict[str, Tuple[HandlerFn, ...]] = {}
+        self.pending: Deque[CombatEvent] = deque()
 
     def subscribe(self, event_key: str, handler: HandlerFn) -> None:
         self._subscribers.setdefault(event_key, []).append(handler)
+        self._dispatch.clear()
 
     def unsubscribe(self, event_key: str, handler: HandlerFn) -> None:
         if event_key in self._subscribers:
             self._subscribers[event_key] = [
                 h for h in self._subscribers[event_key] if h is not handler
             ]
+            self._dispatch.clear()
 
     def emit(self, event: CombatEvent) -> None:
-        targets = (
-            self._subscribers.get(event.event_key, [])
-            + self._subscribers.get("*", [])
-        )
+        targets = self._dispatch.get(event.event_key)
+        if targets is None:
+            targets = (
+                tuple(self._subscribers.get(event.event_key, ()))
+                + tuple(self._subscribers.get("*", ()))
+            )
+            self._dispatch[event.event_key] = targets
         for handler in targets:
             try:
                 handler(event)
@@ -153,15 +168,25 @@ class EventBus:
                     file=sys.stderr,
                 )
 
+    def emit_deferred(self, event: CombatEvent) -> None:
+        """Queue an event for the next drain() instead of dispatching now."""
+        self.pending.append(event)
+
+    def drain(self) -> None:
+        """Dispatch queued events in FIFO order, including any queued while draining."""
+        while self.pending:
+            self.emit(self.pending.popleft())
+
 
 # ============================================================
 # MODIFIER  (event-driven, self-expiring)
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class Modifier:
     """
     Stat modifier that expires when its trigger events fire.
+    Slotted: Combatant.get_stat reads stat_target/value on every lookup.
 
     expires_on    — event keys that trigger expiry check.
                     Empty list = permanent (never self-expires).
@@ -201,17 +226,25 @@ class Modifier:
 # ============================================================
 
 def roll_2d8() -> int:
-    return random.randint(1, 8) + random.randint(1, 8)
+    # One getrandbits call; each 3-bit field is a uniform d8 face (0-7) + 1.
+    bits = random.getrandbits(6)
+    return (bits & 7) + (bits >> 3) + 2
 
 
 def resolve_roll(modifier: int = 0, advantage: bool = False,
-                 disadvantage: bool = False) -> Dict[str, Any]:
+                 disadvantage: bool = False,
+                 rng: Optional[random.Random] = None) -> Dict[str, Any]:
     """
     Roll 2d8 + modifier vs target DC.
     advantage/disadvantage: roll twice, keep high/low respectively.
+    rng: optional seeded Random; defaults to the module-level generator.
     Returns a Chronicle-ready payload dict.
     """
-    rolls = [roll_2d8(), roll_2d8()]
+    # Both 2d8 rolls from a single 12-bit draw (four 3-bit d8 faces),
+    # instead of four randint() calls through randrange/_randbelow.
+    bits = (rng or random).getrandbits(12)
+    rolls = [(bits & 7) + ((bits >> 3) & 7) + 2,
+             ((bits >> 6) & 7) + (bits >> 9) + 2]
     if advantage:
         natural = max(rolls)
     elif disadvantage:
@@ -277,6 +310,8 @@ class Combatant:
         self.speed = speed
         self.action_energy: float = 0.0
         self.modifiers: List[Modifier] = []
+        # stat_target -> modifiers; get_stat only walks the relevant bucket
+        self._mods_by_stat: Dict[str, List[Modifier]] = defaultdict(list)
         self._bus: Optional[EventBus] = None
 
     # ----------------------------------------------------------
@@ -294,6 +329,7 @@ class Combatant:
         expired = [m for m in self.modifiers if m.on_event(event.event_key)]
         for mod in expired:
             self.modifiers.remove(mod)
+            self._mods_by_stat[mod.stat_target].remove(mod)
             if self._bus:
                 self._bus.emit(CombatEvent(
                     event_key=EVT_MODIFIER_EXPIRED,
@@ -316,12 +352,13 @@ class Combatant:
     def get_stat(self, stat_name: str) -> int:
         base = self._base_stats.get(stat_name, 0)
         return base + sum(
-            m.value for m in self.modifiers
-            if m.stat_target == stat_name and not m.is_expired
+            m.value for m in self._mods_by_stat.get(stat_name, ())
+            if not m.is_expired
         )
 
     def add_modifier(self, mod: Modifier) -> None:
         self.modifiers.append(mod)
+        self._mods_by_stat[mod.stat_target].append(mod)
         if self._bus:
             self._bus.emit(CombatEvent(
                 event_key=EVT_MODIFIER_ADDED,
@@ -392,25 +429,42 @@ class FoeFactory:
     }
     BASE_BONUS: int = 3  # Baseline attack/defense bonus at threat 0
 
+    # archetype -> (template, BASE_BONUS, specialized generator).
+    # Rebuilt when either changes; replace template dicts rather than
+    # editing their values in place.
+    _generators: Dict[str, Tuple[Dict[str, Any], int, Callable[[int, str], Combatant]]] = {}
+
+    @staticmethod
+    def _make_generator(base_bonus: int, hp_mult: float, atk_bonus: int,
+                        def_bonus: int, dmg_bonus: int, speed: float,
+                        **_: Any) -> Callable[[int, str], Combatant]:
+        """Bakes one archetype's constants into a closure (threat_level >= 0)."""
+        atk_base = base_bonus + atk_bonus
+        def_base = base_bonus + def_bonus
+
+        def generate(threat_level: int, name: str) -> Combatant:
+            stats = {
+                "attack_bonus":  max(0, min(10, atk_base + threat_level)),
+                "defense_bonus": max(0, min(10, def_base + threat_level)),
+            }
+            hp = max(1, int((10 + threat_level * 5) * hp_mult))
+            return Combatant(
+                name=name, is_player=False, max_hp=hp,
+                stats=stats, damage_bonus=dmg_bonus, speed=speed,
+            )
+        return generate
+
     @classmethod
     def generate(cls, threat_level: int, archetype: str,
                  name_override: str = "") -> Combatant:
         threat_level = max(0, threat_level)
         tmpl = cls.ARCHETYPES.get(archetype, cls.ARCHETYPES["Brute"])
-        base = cls.BASE_BONUS + threat_level
-
-        stats = {
-            "attack_bonus":  max(0, min(10, base + tmpl["atk_bonus"])),
-            "defense_bonus": max(0, min(10, base + tmpl["def_bonus"])),
-        }
-        hp = max(1, int((10 + threat_level * 5) * tmpl["hp_mult"]))
+        entry = cls._generators.get(archetype)
+        if entry is None or entry[0] is not tmpl or entry[1] != cls.BASE_BONUS:
+            entry = (tmpl, cls.BASE_BONUS, cls._make_generator(cls.BASE_BONUS, **tmpl))
+            cls._generators[archetype] = entry
         name = name_override or f"Tier-{threat_level} {archetype}"
-
-        return Combatant(
-            name=name, is_player=False, max_hp=hp,
-            stats=stats, damage_bonus=tmpl["dmg_bonus"],
-            speed=tmpl["speed"],
-        )
+        return entry[2](threat_level, name)
 
 
 # ============================================================
@@ -9,7 +9,7 @@ Status:      Core data validation and loading layer.
 
 import tomllib
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional
 from pydantic import BaseModel, Field, ConfigDict
 
 # ================================================================================
@@ -180,7 +180,10 @@ _CHUNK_TEMPLATE_CACHE: Dict[str, ChunkTemplateDef] = {}
 _BIOME_CACHE: Optional[List[BiomeDef]] = None
 _POPULATION_CACHE: Optional[PopulationDef] = None
 _MODULE_CACHE: Dict[str, ModuleDef] = {}
+_MODULE_CACHE_COMPLETE: bool = False  # set once get_module_defs has globbed the directory
 _AFFIX_CACHE: Optional[List[AffixDef]] = None
+_AFFIX_BY_ID: Dict[str, AffixDef] = {}  # filled alongside _AFFIX_CACHE
+_AFFIX_BY_TAG: Dict[str, List[int]] = {}  # eligible tag -> positions in _AFFIX_CACHE
 
 
 DATA_DIR = Path(__file__).parent.parent / "data"
@@ -350,7 +353,11 @@ def get_module_def(module_id: str) -> ModuleDef:
     return mdef
 
 def get_module_defs() -> Dict[str, ModuleDef]:
-    """Pre-loads all module definitions. Useful for the planner."""
+    """Pre-loads all module definitions. Useful for the planner. Cached globally."""
+    global _MODULE_CACHE_COMPLETE
+    if _MODULE_CACHE_COMPLETE:
+        return _MODULE_CACHE
+
     path = DATA_DIR / "world" / "modules"
     if not path.exists():
         return {}
@@ -360,6 +367,7 @@ def get_module_defs() -> Dict[str, ModuleDef]:
         if mid not in _MODULE_CACHE:
             get_module_def(mid)
             
+    _MODULE_CACHE_COMPLETE = True
     return _MODULE_CACHE
 
 def get_affixes() -> List[AffixDef]:
@@ -377,5 +385,22 @@ def get_affixes() -> List[AffixDef]:
         with open(file, "rb") as f:
             data = tomllib.load(f)
             _AFFIX_CACHE.append(AffixDef(**data))
-            
+
+    _AFFIX_BY_ID.update((a.id, a) for a in _AFFIX_CACHE)
+    for i, a in enumerate(_AFFIX_CACHE):
+        for tag in a.eligible_tags:
+            _AFFIX_BY_TAG.setdefault(tag, []).append(i)
     return _AFFIX_CACHE
+
+def get_affix_def(affix_id: str) -> AffixDef:
+    """Looks up a single affix by id from the cached affix set."""
+    get_affixes()
+    if affix_id not in _AFFIX_BY_ID:
+        raise KeyError(f"Affix definition not found: {affix_id}")
+    return _AFFIX_BY_ID[affix_id]
+
+def get_affixes_for_tags(tags: Iterable[str]) -> List[AffixDef]:
+    """Affixes eligible for any of the given tags, in get_affixes() order."""
+    affixes = get_affixes()
+    hits = {i for t in tags for i in _AFFIX_BY_TAG.get(t, ())}
+    return [affixes[i] for i in sorted(hits)]
@@ -9,7 +9,7 @@ Status:      Production-ready for Phase 2.
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 @dataclass
 class EntityIdentity:
@@ -20,7 +20,7 @@ class EntityIdentity:
     legacy_actor_id: Optional[int] = None
     template_origin: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     x: int
     y: int
@@ -32,7 +32,7 @@ class MovementStats:
     movement_ap_cost: int = 10
     can_occupy_terrain: List[str] = field(default_factory=lambda: ["floor"])
 
-@dataclass
+@dataclass(slots=True)
 class CombatVitals:
     hp: int
     max_hp: int
@@ -52,6 +52,11 @@ class CombatStats:
     damage_bonus: int = 0
 
 @dataclass
+class EffectiveStatsCache:
+    """Memoized get_effective_stats result; removed whenever one of its inputs changes."""
+    stats: CombatStats
+
+@dataclass(slots=True)
 class ItemIdentity:
     entity_id: str
     name: str
@@ -64,11 +69,11 @@ class Quantity:
     amount: int = 1
     max_stack: int = 1
 
-@dataclass
+@dataclass(slots=True)
 class Equippable:
     slot_type: str  # "head", "hand", "torso", etc.
 
-@dataclass
+@dataclass(slots=True)
 class ItemStats:
     attack_bonus: int = 0
     damage_bonus: int = 0
@@ -89,7 +94,7 @@ class Usable:
     ability_id: str
     consumes: bool = True
 
-@dataclass
+@dataclass(slots=True)
 class Disposition:
     reputation: float = 0.0
     moral_weight: float = 0.5
@@ -97,12 +102,12 @@ class Disposition:
     baseline_mood: str = "neutral"
     last_gift_tick: int = -1000
 
-@dataclass
+@dataclass(slots=True)
 class Stress:
     stress_level: float = 0.0
     exodus_risk: float = 0.0
 
-@dataclass
+@dataclass(slots=True)
 class BehaviorProfile:
     threat_weight: float = 1.0   # Positive = repulse, Negative = attract
     affinity_weight: float = 0.0 # Positive = attract
@@ -154,17 +159,17 @@ class DialogueProfile:
 class Faction:
     faction_id: str
 
-@dataclass
+@dataclass(slots=True)
 class SocialAwareness:
     engagement_range: int = 3
     last_interaction_tick: int = -2000
     is_proactive: bool = False # For Rumor/Trade carriers
 
-@dataclass
+@dataclass(slots=True)
 class PartyMember:
     leader_id: int # EntityIdentity.entity_id of the leader
 
-@dataclass
+@dataclass(slots=True)
 class Modifier:
     id: str
     name: str
@@ -176,3 +181,15 @@ class Modifier:
 @dataclass
 class ActiveModifiers:
     effects: List[Modifier] = field(default_factory=list)
+    active_ids: Set[str] = field(default_factory=set) # ids present in effects; O(1) membership
+    by_field: Dict[str, List[Modifier]] = field(default_factory=dict) # stat_field -> effects touching it
+
+    def __post_init__(self) -> None:
+        self.active_ids.update(m.id for m in self.effects)
+        self.reindex()
+
+    def reindex(self) -> None:
+        """Rebuilds by_field from effects."""
+        self.by_field = {}
+        for m in self.effects:
+            self.by_field.setdefault(m.stat_field, []).append(m)
@@ -14,9 +14,11 @@ Architecture notes
 """
 
 from __future__ import annotations
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 
+import numpy as np
 import tcod.ecs
+import tcod.ecs.callbacks
 from engine.ecs.components import (
     ActionEconomy, 
     MovementStats, 
@@ -35,7 +37,9 @@ from engine.ecs.components import (
     SocialAwareness,
     ActiveModifiers,
     Modifier,
-    PartyMember
+    PartyMember,
+    EffectiveStatsCache,
+    Usable
 )
 from engine.combat import (
     EventBus, 
@@ -103,7 +107,7 @@ def interaction_system(registry: tcod.ecs.Registry, actor: tcod.ecs.Entity, x: i
             }
         
         # Container check (has items)
-        if len(target.relation_tags_many["IsCarrying"]) > 0 or Interactable in target.components:
+        if inventory_count(target) > 0 or Interactable in target.components:
             verb = "interact"
             if Interactable in target.components:
                 verb = target.components[Interactable].verb
@@ -158,6 +162,40 @@ def get_adjusted_value(item: tcod.ecs.Entity, standing: float, is_npc_item: bool
         
     return int(base_val * mult)
 
+# ============================================================
+# PLAYER LOOKUP
+# ============================================================
+
+PLAYER_TAG = "IsPlayer"
+
+@tcod.ecs.callbacks.register_component_changed(component=EntityIdentity)
+def _on_identity_changed(entity: tcod.ecs.Entity, old: Any, new: Any) -> None:
+    """Mirrors EntityIdentity.is_player into PLAYER_TAG so get_player() is a tag query."""
+    if new is not None and new.is_player:
+        entity.tags.add(PLAYER_TAG)
+    else:
+        entity.tags.discard(PLAYER_TAG)
+
+def get_player(registry: tcod.ecs.Registry) -> Optional[tcod.ecs.Entity]:
+    """
+    Returns the player entity, or None.
+    The tag follows EntityIdentity assignment; flipping is_player in place won't move it.
+    """
+    for entity in registry.Q.all_of(tags=[PLAYER_TAG]):
+        return entity
+    return None
+
+def find_entity_by_name(registry: tcod.ecs.Registry, name: str) -> Optional[tcod.ecs.Entity]:
+    """
+    Returns the first entity whose EntityIdentity.name matches, or None.
+    Names are display text and get edited in place, so this scans the identity column
+    rather than keeping an index that could go stale.
+    """
+    for entity, ident in registry.Q[tcod.ecs.Entity, EntityIdentity]:
+        if ident.name == name:
+            return entity
+    return None
+
 # ============================================================
 # AI SYSTEMS
 # ============================================================
@@ -167,6 +205,10 @@ def ai_decision_system(registry: tcod.ecs.Registry, ai_sys: "InfluenceMapSystem"
     Selects best action for NPCs based on influence maps.
     Writes PendingAction component to chosen entities.
     """
+    # Moves are only queued here, so one position snapshot serves every NPC
+    from engine.ecs.spatial import PositionBuffer
+    positions = PositionBuffer.from_registry(registry)
+    
     for entity in registry.Q.all_of(components=[ActionEconomy, BehaviorProfile, Position, EntityIdentity]):
         if entity.components[EntityIdentity].is_player:
             continue
@@ -188,7 +230,7 @@ def ai_decision_system(registry: tcod.ecs.Registry, ai_sys: "InfluenceMapSystem"
             ai_sys.add_affinity_seed(px, py, weight=20.0) # Maximum pull
                 
         # Update maps for THIS NPC (so it is not its own seed)
-        ai_sys.update(registry, px, py, viewer=entity)
+        ai_sys.update(registry, px, py, viewer=entity, positions=positions)
         
         economy = entity.components[ActionEconomy]
         if economy.ap_pool < 10: # Min cost for movement
@@ -201,29 +243,19 @@ def ai_decision_system(registry: tcod.ecs.Registry, ai_sys: "InfluenceMapSystem"
         profile = entity.components[BehaviorProfile]
         pos = entity.components[Position]
         
-        # Get personal desire map
-        desire_map = ai_sys.get_desire_map(profile)
+        # Personal desire, only for the 3x3 neighbourhood we can step into
+        window = ai_sys.get_desire_window(profile, pos.x, pos.y)
         
         # 1. Evaluate Neighbors for Movement
-        # Initialize with CURRENT tile value
-        lx_curr, ly_curr = pos.x - ai_sys.off_x, pos.y - ai_sys.off_y
-        if 0 <= lx_curr < ai_sys.width and 0 <= ly_curr < ai_sys.height:
-            best_val = desire_map[ly_curr, lx_curr]
-        else:
-            best_val = -1000.0
-            
+        # Initialize with CURRENT tile value (window centre; -inf when off-map)
+        best_val = window[1, 1] if np.isfinite(window[1, 1]) else -1000.0
         best_pos = (pos.x, pos.y)
         
-        # Simple 1-tile lookahead
-        for dy in range(-1, 2):
-            for dx in range(-1, 2):
-                nx, ny = pos.x + dx, pos.y + dy
-                lx, ly = nx - ai_sys.off_x, ny - ai_sys.off_y
-                if 0 <= lx < ai_sys.width and 0 <= ly < ai_sys.height:
-                    val = desire_map[ly, lx]
-                    if val > best_val:
-                        best_val = val
-                        best_pos = (nx, ny)
+        # Simple 1-tile lookahead: argmax keeps the first row-major maximum
+        best_idx = int(np.argmax(window))
+        if window.flat[best_idx] > best_val:
+            dy, dx = divmod(best_idx, 3)
+            best_pos = (pos.x + dx - 1, pos.y + dy - 1)
         
         # 2. Queue Action
         success = False
@@ -239,10 +271,12 @@ def ai_decision_system(registry: tcod.ecs.Registry, ai_sys: "InfluenceMapSystem"
             if CombatVitals in entity.components:
                 vitals = entity.components[CombatVitals]
                 if vitals.hp / vitals.max_hp < 0.5:
-                    # Look for potion in inventory
-                    for item in entity.relation_tags_many["IsCarrying"]:
-                        from engine.ecs.components import Usable
-                        if Usable in item.components and item.components[Usable].ability_id == "heal":
+                    # Look for potion in inventory (query narrows to carried Usables)
+                    carried_usables = registry.Q.all_of(
+                        components=[Usable], relations=[(entity, "IsCarrying", None)]
+                    )
+                    for item in carried_usables:
+                        if item.components[Usable].ability_id == "heal":
                             entity.components[PendingAction] = PendingAction(
                                 action_type="use",
                                 target_entity=item
@@ -267,17 +301,33 @@ def get_attr_mod(entity: tcod.ecs.Entity, attr_id: str) -> int:
     
     # Add Active Modifiers to score
     if ActiveModifiers in entity.components:
-        for mod in entity.components[ActiveModifiers].effects:
-            if mod.stat_field == attr_id:
-                val += int(mod.magnitude)
+        for mod in entity.components[ActiveModifiers].by_field.get(attr_id, ()):
+            val += int(mod.magnitude)
                 
     return (val - 10) // 2
 
+def invalidate_effective_stats(entity: tcod.ecs.Entity) -> None:
+    """
+    Drops the memoized effective stats. The equip/drop and modifier systems call
+    this themselves; direct IsEquipped or in-place score edits must call it too.
+    """
+    entity.components.pop(EffectiveStatsCache, None)
+
+@tcod.ecs.callbacks.register_component_changed(component=CombatStats)
+@tcod.ecs.callbacks.register_component_changed(component=Attributes)
+@tcod.ecs.callbacks.register_component_changed(component=ActiveModifiers)
+def _on_stat_input_changed(entity: tcod.ecs.Entity, old: Any, new: Any) -> None:
+    invalidate_effective_stats(entity)
+
 def get_effective_stats(entity: tcod.ecs.Entity) -> CombatStats:
     """
     Calculates total stats by summing base CombatStats, ItemStats, Attribute mods, and ActiveModifiers.
-    Returns a new CombatStats object containing the aggregated values.
+    The result is memoized in EffectiveStatsCache until invalidate_effective_stats; treat it as read-only.
     """
+    cache = entity.components.get(EffectiveStatsCache)
+    if cache is not None:
+        return cache.stats
+
     base = entity.components.get(CombatStats, CombatStats())
     
     # 1. Start with Base
@@ -301,16 +351,18 @@ def get_effective_stats(entity: tcod.ecs.Entity) -> CombatStats:
             
     # 4. Add Active Modifiers
     if ActiveModifiers in entity.components:
-        for mod in entity.components[ActiveModifiers].effects:
-            if mod.stat_field == "attack_bonus": total_atk += int(mod.magnitude)
-            elif mod.stat_field == "defense_bonus" or mod.stat_field == "protection": total_dfn += int(mod.magnitude)
-            elif mod.stat_field == "damage_bonus": total_dmg += int(mod.magnitude)
+        by_field = entity.components[ActiveModifiers].by_field
+        total_atk += sum(int(m.magnitude) for m in by_field.get("attack_bonus", ()))
+        total_dfn += sum(int(m.magnitude) for f in ("defense_bonus", "protection") for m in by_field.get(f, ()))
+        total_dmg += sum(int(m.magnitude) for m in by_field.get("damage_bonus", ()))
             
-    return CombatStats(
+    stats = CombatStats(
         attack_bonus=total_atk,
         defense_bonus=total_dfn,
         damage_bonus=total_dmg
     )
+    entity.components[EffectiveStatsCache] = EffectiveStatsCache(stats=stats)
+    return stats
 
 # = ===========================================================
 # MODIFIER SYSTEMS
@@ -318,15 +370,27 @@ def get_effective_stats(entity: tcod.ecs.Entity) -> CombatStats:
 
 def modifier_tick_system(registry: tcod.ecs.Registry) -> None:
     """Decrements duration of all active modifiers and purges expired ones."""
-    for entity in registry.Q.all_of(components=[ActiveModifiers]):
-        active = entity.components[ActiveModifiers]
-        # Iterate in reverse or filter to allow safe removal
-        remaining = []
+    # Q[...] reads the component column directly; per-entity .components[] lookups dominated this loop
+    for entity, active in registry.Q[tcod.ecs.Entity, ActiveModifiers]:
+        if not active.effects:
+            continue
+        # Decrement in place; only rebuild the list on a tick where something expires
+        expiring = False
         for mod in active.effects:
             mod.duration -= 1
+            if mod.duration <= 0:
+                expiring = True
+        if not expiring:
+            continue
+        remaining = []
+        for mod in active.effects:
             if mod.duration > 0:
                 remaining.append(mod)
+            else:
+                active.active_ids.discard(mod.id)
+        invalidate_effective_stats(entity)
         active.effects = remaining
+        active.reindex()
 
 def apply_modifier_blueprint(entity: tcod.ecs.Entity, m_blue: Dict[str, Any]):
     """Applies a modifier blueprint to an entity. Handles duration refreshing for duplicates."""
@@ -336,19 +400,24 @@ def apply_modifier_blueprint(entity: tcod.ecs.Entity, m_blue: Dict[str, Any]):
     active = entity.components[ActiveModifiers]
     
     # Option A: Refresh Duration if ID matches
-    for existing in active.effects:
-        if existing.id == m_blue["id"]:
-            existing.duration = m_blue.get("duration", 100)
-            return
+    if m_blue["id"] in active.active_ids:
+        for existing in active.effects:
+            if existing.id == m_blue["id"]:
+                existing.duration = m_blue.get("duration", 100)
+                return
             
     # Add new
-    active.effects.append(Modifier(
+    invalidate_effective_stats(entity)
+    active.active_ids.add(m_blue["id"])
+    mod = Modifier(
         id=m_blue["id"],
         name=m_blue.get("name", m_blue["id"]),
         stat_field=m_blue["stat_field"],
         magnitude=m_blue["magnitude"],
         duration=m_blue.get("duration", 100)
-    ))
+    )
+    active.effects.append(mod)
+    active.by_field.setdefault(mod.stat_field, []).append(mod)
 
 def get_terrain_modifiers(terrain_type: str) -> List[Dict[str, Any]]:
     """Returns a list of modifier blueprints for a given terrain type."""
@@ -378,16 +447,19 @@ def environmental_modifier_system(registry: tcod.ecs.Registry, world_manager: "C
             for m_blue in biome.ambient_modifiers:
                 apply_modifier_blueprint(entity, m_blue)
 
-def evaluate_formula(formula: str, entity: tcod.ecs.Entity) -> int:
+def evaluate_formula(formula: str, entity: tcod.ecs.Entity,
+                     rng: Optional["random.Random"] = None) -> int:
     """
     Parses and evaluates a magnitude formula (e.g. '1d8 + @might_mod').
     Supported: 
       - NdM (Dice)
       - @stat_id (Attribute modifier)
       - Integers
+    Dice use rng when given, else the module-level generator.
     """
     import random
     import re
+    roll = (rng or random).randint
     
     parts = formula.replace(" ", "").split("+")
     total = 0
@@ -406,7 +478,7 @@ def evaluate_formula(formula: str, entity: tcod.ecs.Entity) -> int:
             if match:
                 num, sides = map(int, match.groups())
                 for _ in range(num):
-                    total += random.randint(1, sides)
+                    total += roll(1, sides)
                     
         # 3. Static Integer
         else:
@@ -439,15 +511,18 @@ def resolve_effect_targets(registry: tcod.ecs.Registry, attacker: tcod.ecs.Entit
 # TURN SYSTEMS
 # ============================================================
 
-def turn_resolution_system(registry: tcod.ecs.Registry) -> None:
+def turn_resolution_system(registry: tcod.ecs.Registry) -> bool:
     """
     Tick action_energy for all eligible actors.
     Query: all entities with [ActionEconomy, MovementStats]
+    Returns True if any actor is at or above ENERGY_THRESHOLD afterwards.
     """
-    for entity in registry.Q.all_of(components=[ActionEconomy, MovementStats]):
-        economy = entity.components[ActionEconomy]
-        stats = entity.components[MovementStats]
+    any_ready = False
+    for economy, stats in registry.Q[ActionEconomy, MovementStats]:
         economy.action_energy += stats.speed
+        if economy.action_energy >= ENERGY_THRESHOLD:
+            any_ready = True
+    return any_ready
 
 
 def action_economy_reset_system(registry: tcod.ecs.Registry, bus: EventBus) -> None:
@@ -455,8 +530,7 @@ def action_economy_reset_system(registry: tcod.ecs.Registry, bus: EventBus) -> N
     Reset AP pool and emit EVT_TURN_STARTED for eligible actors.
     Query: all entities with [ActionEconomy] where energy >= threshold
     """
-    for entity in registry.Q.all_of(components=[ActionEconomy]):
-        economy = entity.components[ActionEconomy]
+    for entity, economy in registry.Q[tcod.ecs.Entity, ActionEconomy]:
         if economy.action_energy >= ENERGY_THRESHOLD:
             # Reset economy state
             economy.ap_pool = AP_POOL_SIZE
@@ -464,7 +538,6 @@ def action_economy_reset_system(registry: tcod.ecs.Registry, bus: EventBus) -> N
             
             # Emit turn start event
             source_name = str(entity)
-            from engine.ecs.components import EntityIdentity
             if EntityIdentity in entity.components:
                 source_name = entity.components[EntityIdentity].name
                 
@@ -548,7 +621,6 @@ def action_resolution_system(
             economy.ap_spent_this_turn += ap_cost
             
             source_name = str(entity)
-            from engine.ecs.components import EntityIdentity
             if EntityIdentity in entity.components:
                 source_name = entity.components[EntityIdentity].name
             
@@ -577,7 +649,6 @@ def action_resolution_system(
     economy.ap_spent_this_turn += ap_cost
     
     source_name = str(entity)
-    from engine.ecs.components import EntityIdentity
     if EntityIdentity in entity.components:
         source_name = entity.components[EntityIdentity].name
         
@@ -595,6 +666,14 @@ def action_resolution_system(
 # INVENTORY SYSTEMS
 # ============================================================
 
+def inventory_count(entity: tcod.ecs.Entity) -> int:
+    """Number of items the entity carries, without copying the relation set."""
+    return len(entity.relation_tags_many["IsCarrying"])
+
+def iter_carried(entity: tcod.ecs.Entity) -> Iterator[tcod.ecs.Entity]:
+    """Iterates carried items in place; don't add/remove IsCarrying while iterating."""
+    return iter(entity.relation_tags_many["IsCarrying"])
+
 def pickup_item_system(actor: tcod.ecs.Entity, item: tcod.ecs.Entity) -> bool:
     """Moves item from Floor (Position) to Inventory (IsCarrying relation)."""
     if Position not in actor.components or Position not in item.components:
@@ -625,6 +704,7 @@ def drop_item_system(actor: tcod.ecs.Entity, item: tcod.ecs.Entity) -> bool:
     actor.relation_tags_many["IsCarrying"].remove(item)
     if item in actor.relation_tags_many["IsEquipped"]:
         actor.relation_tags_many["IsEquipped"].remove(item)
+        invalidate_effective_stats(actor)
         
     item.components[Position] = Position(x=actor_pos.x, y=actor_pos.y)
     return True
@@ -652,4 +732,5 @@ def equip_item_system(actor: tcod.ecs.Entity, item: tcod.ecs.Entity) -> bool:
         return False # Slot occupied
         
     actor.relation_tags_many["IsEquipped"].add(item)
+    invalidate_effective_stats(actor)
     return True
@@ -3,12 +3,14 @@ ZEngine — engine/equilibrium.py
 Equilibrium System: World vitality, migration, and conduction logic.
 ====================================================================
 Version:     0.1  (Phase 2 — canonical implementation)
-Stack:       Python 3.14.3
+Stack:       Python 3.14.3 | NumPy
 Status:      Production-ready for Phase 2.
 """
 
 from __future__ import annotations
 
+import numpy as np
+
 EQUILIBRIUM_BASE_RESISTANCE: int = 40
 CONDUCTION_COEFFICIENT: float = 0.3
 CONDUCTION_ATTENUATION: float = 0.6
@@ -21,6 +23,15 @@ def compute_migration_risk(living_count: int, vitality: float) -> int:
     taper_threshold = EQUILIBRIUM_BASE_RESISTANCE + (living_count * vitality)
     return int(100 - taper_threshold)
 
+def compute_migration_risk_batch(living_counts: np.ndarray, vitalities: np.ndarray) -> np.ndarray:
+    """
+    Vectorized compute_migration_risk for many nodes at once.
+    Inputs broadcast; truncates toward zero like int() in the scalar form.
+    """
+    lc = np.asarray(living_counts, dtype=np.float64)
+    v = np.asarray(vitalities, dtype=np.float64)
+    return (100 - (EQUILIBRIUM_BASE_RESISTANCE + lc * v)).astype(np.int64)
+
 def calculate_conduction_magnitude(original_magnitude: float, distance: float) -> float:
     """
     Calculate the magnitude of a propagated mood spike.
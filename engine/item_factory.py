@@ -10,7 +10,7 @@ Status:      Transactional item instantiation, merging, and procedural augmentat
 import random
 from typing import Optional, List, Dict, Any
 import tcod.ecs
-from engine.data_loader import get_item_def, get_recipes, get_affixes, AffixDef
+from engine.data_loader import get_item_def, get_recipes, get_affixes_for_tags, AffixDef
 from engine.ecs.components import ItemIdentity, Equippable, ItemStats, Quantity, Lineage, Usable
 
 def roll_rarity() -> str:
@@ -22,10 +22,8 @@ def roll_rarity() -> str:
 
 def select_affixes(item_tags: set[str], count: int) -> List[AffixDef]:
     """Selects valid affixes based on item tags and weights."""
-    all_affixes = get_affixes()
-    
-    # Filter by tags
-    valid = [a for a in all_affixes if any(t in item_tags for t in a.eligible_tags)]
+    # Union of the per-tag buckets (inverted index built once by the loader)
+    valid = get_affixes_for_tags(item_tags)
     if not valid: return []
     
     # Selection
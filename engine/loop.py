@@ -10,7 +10,7 @@ Status:      Integration entry point.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional, List, Any, Dict
+from typing import Optional, List, Any, Dict, TextIO
 import random
 
 import tcod.ecs
@@ -30,7 +30,10 @@ from engine.combat import (
 from engine.ecs.systems import (
     turn_resolution_system, 
     action_economy_reset_system, 
-    action_resolution_system
+    action_resolution_system,
+    inventory_count,
+    iter_carried,
+    get_player
 )
 from engine.social_state import SocialStateSystem
 from engine.chronicle import ChronicleInscriber, GameTimestamp
@@ -66,8 +69,12 @@ class SimulationLoop:
     Core executor for the ZEngine game loop.
     Wires the EventBus, Registry, ChronicleInscriber, and SocialStateSystem.
     """
-    def __init__(self, chronicle_path: Optional[Path] = None):
-        if chronicle_path is None:
+    def __init__(self, chronicle_path: Optional[Path] = None,
+                 chronicle_stream: Optional[TextIO] = None,
+                 chronicle_mode: str = "sync",
+                 rng: Optional[random.Random] = None):
+        # A stream (e.g. io.StringIO) keeps the chronicle off disk entirely
+        if chronicle_path is None and chronicle_stream is None:
             chronicle_path = Path("sessions/chronicle.jsonl")
 
         self.registry = tcod.ecs.Registry()
@@ -92,12 +99,17 @@ class SimulationLoop:
             bus=self.bus,
             chronicle_path=chronicle_path,
             clock=self.clock,
-            player_present=True
+            player_present=True,
+            chronicle_stream=chronicle_stream,
+            mode=chronicle_mode
         )
         self.social_system = SocialStateSystem(self.bus, self.registry, self.faction_standing)
         
+        # Seeded Random for reproducible runs (world seed, combat rolls)
+        self.rng = rng if rng is not None else random.Random()
+
         # World Generation
-        _world_seed = random.randint(1, 100000)
+        _world_seed = self.rng.randint(1, 100000)
         self.territory = TerritoryManager(world_seed=_world_seed)
         self.world = ChunkManager(world_seed=_world_seed, territory=self.territory)
 
@@ -153,9 +165,8 @@ class SimulationLoop:
             data["party_member"] = {"leader_id": entity.components[PartyMember].leader_id}
 
         # Inventory
-        carried = list(entity.relation_tags_many["IsCarrying"])
-        if carried:
-            data["inventory"] = [self._serialize_entity(item) for item in carried]
+        if inventory_count(entity):
+            data["inventory"] = [self._serialize_entity(item) for item in iter_carried(entity)]
             
         return data
 
@@ -227,8 +238,15 @@ class SimulationLoop:
 
     def close_session(self) -> None:
         """Closes the current tracking session but does NOT write a spatial snapshot."""
+        self.bus.drain()
         self.inscriber.close_session()
 
+    def emit_many(self, events: List[CombatEvent]) -> None:
+        """Emits events in order; the chronicle writes their entries in one append."""
+        with self.inscriber.buffered():
+            for event in events:
+                self.bus.emit(event)
+
     def save_session(self, snapshot_path: Optional[Path] = None) -> None:
         """
         Saves the critical world state to JSON.
@@ -238,7 +256,18 @@ class SimulationLoop:
             snapshot_path = Path("sessions/spatial_snapshot.json")
             
         snapshot_path.parent.mkdir(parents=True, exist_ok=True)
-        
+        data = self._snapshot_dict()
+            
+        with open(snapshot_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+    def save_session_to_bytes(self) -> bytes:
+        """In-memory snapshot (pickle); same content as save_session, no disk or JSON text."""
+        import pickle
+        return pickle.dumps(self._snapshot_dict(), protocol=5)
+
+    def _snapshot_dict(self) -> Dict[str, Any]:
+        """Builds the JSON-compatible snapshot shared by the disk and in-memory paths."""
         # Prepare territory overrides
         t_overrides = {}
         if hasattr(self, "territory") and self.territory:
@@ -267,15 +296,17 @@ class SimulationLoop:
                 "tick": self.clock.tick,
                 "world_seed": self.world.world_seed
             },
-            "faction_standing": self.faction_standing,
+            # Parallel id/value columns: one short key pair instead of a key per faction
+            "faction_standing": {
+                "ids": list(self.faction_standing.keys()),
+                "vals": list(self.faction_standing.values())
+            },
             "territory_overrides": t_overrides,
             "virtual_entities": {f"{k[0]}_{k[1]}": v for k, v in self.virtual_entities.items()},
             "exploration": self.exploration.get_state(),
             "entities": entities
         }
-            
-        with open(snapshot_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        return data
             
     def resume_session(self, snapshot_path: Optional[Path] = None) -> None:
         """Restores the world from a snapshot."""
@@ -289,12 +320,19 @@ class SimulationLoop:
             
         with open(snapshot_path, "r", encoding="utf-8") as f:
             data = json.load(f)
-            
+        self._restore_snapshot(data)
+
+    def resume_from_bytes(self, blob: bytes) -> None:
+        """Restores the world from save_session_to_bytes() output. Trusted, same-install data only."""
+        import pickle
+        self._restore_snapshot(pickle.loads(blob))
+
+    def _restore_snapshot(self, data: Dict[str, Any]) -> None:
         # Restore world
         wdata = data.get("world", {})
         self.clock = GameTimestamp(era=wdata.get("era", "Recent"), cycle=wdata.get("cycle", 1), tick=wdata.get("tick", 1))
         self.inscriber.clock = self.clock
-        _world_seed = wdata.get("world_seed", random.randint(1, 10000))
+        _world_seed = wdata.get("world_seed", self.rng.randint(1, 10000))
         self.territory = TerritoryManager(world_seed=_world_seed)
         
         # Restore territory overrides
@@ -321,8 +359,12 @@ class SimulationLoop:
         if "exploration" in data:
             self.exploration.load_state(data["exploration"])
         
-        # Restore Faction Standings
-        self.faction_standing = data.get("faction_standing", {})
+        # Restore Faction Standings (in place: SocialStateSystem shares this dict)
+        fdata = data.get("faction_standing", {})
+        if "ids" in fdata and "vals" in fdata:
+            fdata = dict(zip(fdata["ids"], fdata["vals"]))
+        self.faction_standing.clear()
+        self.faction_standing.update(fdata)
         
         # Restore registry
         self.registry = tcod.ecs.Registry()
@@ -345,11 +387,10 @@ class SimulationLoop:
         
         # 1. Dematerialization: Cull distant entities
         to_cull = []
-        for entity in self.registry.Q.all_of(components=[Position, EntityIdentity]):
-            ident = entity.components[EntityIdentity]
+        # Column query: this scan visits every live actor on each player move
+        for entity, ident, pos in self.registry.Q[tcod.ecs.Entity, EntityIdentity, Position]:
             if ident.is_player: continue
             
-            pos = entity.components[Position]
             ex_chunk, ey_chunk = pos.x // chunk_size, pos.y // chunk_size
             
             dist = max(abs(ex_chunk - px_chunk), abs(ey_chunk - py_chunk))
@@ -360,7 +401,7 @@ class SimulationLoop:
                     # Only keep if they were damaged or have items
                     vitals = entity.components.get(CombatVitals)
                     has_delta = vitals and vitals.hp < vitals.max_hp
-                    has_items = len(list(entity.relation_tags_many["IsCarrying"])) > 0
+                    has_items = inventory_count(entity) > 0
                     if not (has_delta or has_items):
                         to_cull.append((entity, None))
                         continue
@@ -369,10 +410,7 @@ class SimulationLoop:
 
         for entity, chunk_key in to_cull:
             if chunk_key:
-                serialized = self._serialize_entity(entity)
-                if chunk_key not in self.virtual_entities:
-                    self.virtual_entities[chunk_key] = []
-                self.virtual_entities[chunk_key].append(serialized)
+                self.virtual_entities.setdefault(chunk_key, []).append(self._serialize_entity(entity))
             
             # Remove from active registry
             # We clear() to destroy the entity ID and components in this registry
@@ -412,18 +450,18 @@ class SimulationLoop:
         # Every 10 ticks, check lifecycle
         if self.clock.tick % 10 == 0:
             px, py = 0, 0
-            for ent in self.registry.Q.all_of(components=[EntityIdentity, Position]):
-                if ent.components[EntityIdentity].is_player:
-                    px, py = ent.components[Position].x, ent.components[Position].y
-                    break
+            player_ent = get_player(self.registry)
+            if player_ent is not None and Position in player_ent.components:
+                px, py = player_ent.components[Position].x, player_ent.components[Position].y
             self.manage_entity_lifecycle(px, py)
 
         # Modifier Lifecycle (Decay old effects)
         from engine.ecs.systems import modifier_tick_system
         modifier_tick_system(self.registry)
 
-        turn_resolution_system(self.registry)
-        action_economy_reset_system(self.registry, self.bus)
+        # Nobody crossed the energy threshold: the AP reset pass has nothing to do
+        if turn_resolution_system(self.registry):
+            action_economy_reset_system(self.registry, self.bus)
         
         # Environmental Effects (Apply location-based effects)
         from engine.ecs.systems import environmental_modifier_system
@@ -434,12 +472,11 @@ class SimulationLoop:
             self.ai_influence = InfluenceMapSystem()
             
         px, py = 0, 0
-        player_ent = None
-        for ent in self.registry.Q.all_of(components=[EntityIdentity, Position]):
-            if ent.components[EntityIdentity].is_player:
-                px, py = ent.components[Position].x, ent.components[Position].y
-                player_ent = ent
-                break
+        player_ent = get_player(self.registry)
+        if player_ent is not None and Position in player_ent.components:
+            px, py = player_ent.components[Position].x, player_ent.components[Position].y
+        else:
+            player_ent = None
         
         from engine.ecs.systems import ai_decision_system
         ai_decision_system(self.registry, self.ai_influence, px, py, current_tick=self.clock.tick)
@@ -447,9 +484,9 @@ class SimulationLoop:
         # Check for Proactive Social Engagement
         self.pending_social_popup = self.check_proactive_social(player_ent)
         
+        # PendingAction is the per-tick command buffer: systems queue, this loop applies them in one pass
         from engine.ecs.components import PendingAction
-        for ent in list(self.registry.Q.all_of(components=[PendingAction])):
-            pending = ent.components[PendingAction]
+        for ent, pending in self.registry.Q[tcod.ecs.Entity, PendingAction]:
             if pending.action_type == "move":
                 dx, dy = pending.payload.get("dx", 0), pending.payload.get("dy", 0)
                 from engine.ecs.components import MovementStats, ActionEconomy
@@ -466,17 +503,17 @@ class SimulationLoop:
             
             del ent.components[PendingAction]
 
+        # Deferred events (e.g. faction conduction) settle once per tick
+        self.bus.drain()
+
     def check_proactive_social(self, player: tcod.ecs.Entity) -> Optional[Dict[str, Any]]:
         """Checks for adjacent NPCs who want to initiate dialogue."""
         if not player: return None
         
         ppos = player.components[Position]
         
-        for npc in self.registry.Q.all_of(components=[Position, SocialAwareness, EntityIdentity]):
-            if npc.components[EntityIdentity].is_player: continue
-            
-            npos = npc.components[Position]
-            soc = npc.components[SocialAwareness]
+        for npc, npos, soc, ident in self.registry.Q[tcod.ecs.Entity, Position, SocialAwareness, EntityIdentity]:
+            if ident.is_player: continue
             
             # Adjacent check
             dist = max(abs(npos.x - ppos.x), abs(npos.y - ppos.y))
@@ -597,7 +634,7 @@ class SimulationLoop:
         target_name = target.components.get(EntityIdentity).name if EntityIdentity in target.components else "Unknown"
         
         # 1. Evaluate Magnitude
-        magnitude = evaluate_formula(effect_def.magnitude, attacker)
+        magnitude = evaluate_formula(effect_def.magnitude, attacker, rng=self.rng)
         
         # 2. Dispatch by Type
         if effect_def.effect_type == "damage":
@@ -606,7 +643,7 @@ class SimulationLoop:
             def_stats = get_effective_stats(target)
             
             dc = BASE_HIT_DC + def_stats.defense_bonus
-            roll_data = resolve_roll(modifier=atk_stats.attack_bonus)
+            roll_data = resolve_roll(modifier=atk_stats.attack_bonus, rng=self.rng)
             outcome = roll_outcome_category(roll_data["total"], dc, roll_data["is_crit"], roll_data["is_fumble"])
             
             if outcome in ("hit", "critical", "graze"):
@@ -20,6 +20,7 @@ from engine.combat import (
     EVT_SOCIAL_DISPOSITION_SHIFT,
 )
 from engine.ecs.components import EntityIdentity, Disposition, Stress, Faction
+from engine.ecs.systems import find_entity_by_name
 
 class SocialStateSystem:
     def __init__(self, bus: EventBus, registry: tcod.ecs.Registry, faction_standing: Optional[Dict[str, float]] = None):
@@ -35,31 +36,30 @@ class SocialStateSystem:
 
     def _get_entity_by_name(self, name: str) -> Optional[tcod.ecs.Entity]:
         """Finds an entity by its display name in EntityIdentity."""
-        for entity in self.registry.Q.all_of(components=[EntityIdentity]):
-            if entity.components[EntityIdentity].name == name:
-                return entity
-        return None
+        return find_entity_by_name(self.registry, name)
 
     def get_stress(self, name: str) -> float:
         """Helper to get stress level by entity name."""
         entity = self._get_entity_by_name(name)
         if entity:
-            if Stress not in entity.components:
-                entity.components[Stress] = Stress()
-            return entity.components[Stress].stress_level
+            comp = entity.components.get(Stress)
+            if comp is None:
+                comp = entity.components[Stress] = Stress()
+            return comp.stress_level
         return 0.0
 
     def get_reputation(self, name: str) -> float:
         """Helper to get reputation by entity name."""
         entity = self._get_entity_by_name(name)
         if entity:
-            if Disposition in entity.components:
-                return entity.components[Disposition].reputation
+            disp = entity.components.get(Disposition)
+            if disp is not None:
+                return disp.reputation
             
             # Check Faction Standing fallback
-            if Faction in entity.components:
-                fid = entity.components[Faction].faction_id
-                return self.faction_standing.get(fid, 0.0)
+            faction = entity.components.get(Faction)
+            if faction is not None:
+                return self.faction_standing.get(faction.faction_id, 0.0)
                 
         return 0.0
 
@@ -83,7 +83,9 @@ class SocialStateSystem:
         
         # Reputation loss for killing someone
         # (Assuming player is the cause for now in MVP)
-        self.bus.emit(CombatEvent(
+        # Deferred: the faction conduction cascade runs at tick end rather
+        # than re-entering the bus from inside the death dispatch.
+        self.bus.emit_deferred(CombatEvent(
             event_key=EVT_SOCIAL_DISPOSITION_SHIFT,
             source=event.source,
             data={"delta": -0.2, "cause": "killing"}
@@ -92,9 +94,9 @@ class SocialStateSystem:
     def _on_stress_spike(self, event: CombatEvent) -> None:
         entity = self._get_entity_by_name(event.source)
         if entity:
-            if Stress not in entity.components:
-                entity.components[Stress] = Stress()
-            comp = entity.components[Stress]
+            comp = entity.components.get(Stress)
+            if comp is None:
+                comp = entity.components[Stress] = Stress()
             comp.stress_level = min(1.0, comp.stress_level + event.data.get("magnitude", 0.0))
 
     def _on_disposition_shift(self, event: CombatEvent) -> None:
@@ -105,9 +107,9 @@ class SocialStateSystem:
         delta = event.data.get("delta", 0.0)
         
         # 1. Update Individual Disposition
-        if Disposition not in entity.components:
-            entity.components[Disposition] = Disposition()
-        disp = entity.components[Disposition]
+        disp = entity.components.get(Disposition)
+        if disp is None:
+            disp = entity.components[Disposition] = Disposition()
         disp.reputation = max(-1.0, min(1.0, disp.reputation + delta))
         
         # 2. Conduction: Update Faction Standing
@@ -8,16 +8,19 @@ Status:      Ready for testing.
 """
 
 from __future__ import annotations
-from typing import Optional, List, Dict, Any
+from typing import Callable, Optional, List, Dict, Any, Tuple
+import operator
 import random
 import tcod.ecs
 
 from engine.data_loader import get_entity_def, get_item_def
 from engine.item_factory import create_item
+from engine.ecs.systems import get_player
 from engine.ecs.components import (
     EntityIdentity, Position, CombatVitals, CombatStats, 
     ActionEconomy, MovementStats, BehaviorProfile, Attributes,
-    ItemIdentity, DoorState, BlocksMovement, Interactable, Faction, SocialAwareness
+    ItemIdentity, DoorState, BlocksMovement, Interactable, Faction, SocialAwareness,
+    Disposition, Stress
 )
 
 def spawn_npc(registry: tcod.ecs.Registry, entity_id: str, x: int, y: int, name_override: Optional[str] = None, faction_id: Optional[str] = None, is_player: bool = False) -> tcod.ecs.Entity:
@@ -46,7 +49,8 @@ def spawn_npc(registry: tcod.ecs.Registry, entity_id: str, x: int, y: int, name_
     entity.components[MovementStats] = MovementStats(speed=entity_def.speed)
     
     # 5. Attributes
-    entity.components[Attributes] = Attributes(scores=entity_def.attributes)
+    # Own copy: entity_def is the cached blueprint shared by every spawn
+    entity.components[Attributes] = Attributes(scores=dict(entity_def.attributes))
     
     # 6. AI/Behavior
     if not is_player:
@@ -141,44 +145,54 @@ def spawn_window(registry: tcod.ecs.Registry, x: int, y: int) -> tcod.ecs.Entity
     window.components[CombatVitals] = CombatVitals(hp=5, max_hp=5)
     return window
 
+_CONDITION_OPS: Dict[str, Callable[[float, float], bool]] = {"<": operator.lt, ">": operator.gt, "==": operator.eq}
+_CONDITION_SOURCES: Dict[str, Tuple[type, str]] = {"reputation": (Disposition, "reputation"), "stress": (Stress, "stress_level")}
+# condition string -> (component, field, op, threshold); None when the condition always passes
+_CONDITION_CACHE: Dict[str, Optional[Tuple[Optional[type], str, Callable[[float, float], bool], float]]] = {}
+
+def _compile_condition(condition: str):
+    """Parses a 'var op value' condition once; later calls hit _CONDITION_CACHE."""
+    if condition in _CONDITION_CACHE:
+        return _CONDITION_CACHE[condition]
+
+    compiled = None
+    parts = condition.split()
+    if len(parts) == 3:
+        var, op, val = parts
+        try:
+            threshold = float(val)
+        except ValueError:
+            threshold = None
+        if threshold is not None and op in _CONDITION_OPS:
+            # Unknown variables read as 0.0
+            comp_type, field_name = _CONDITION_SOURCES.get(var, (None, ""))
+            compiled = (comp_type, field_name, _CONDITION_OPS[op], threshold)
+
+    _CONDITION_CACHE[condition] = compiled
+    return compiled
+
 def evaluate_condition(registry: tcod.ecs.Registry, condition: str) -> bool:
     """Evaluates a string condition against the current ECS state."""
     if not condition:
         return True
         
-    from engine.ecs.components import Disposition, Stress
-    player = None
-    for ent in registry.Q.all_of(components=[EntityIdentity]):
-        if ent.components[EntityIdentity].is_player:
-            player = ent
-            break
+    player = get_player(registry)
             
     if not player:
         return False
         
-    parts = condition.split()
-    if len(parts) != 3:
-        return True
-        
-    var, op, val = parts
-    try:
-        threshold = float(val)
-    except ValueError:
+    compiled = _compile_condition(condition)
+    if compiled is None:
         return True
         
+    comp_type, field_name, op, threshold = compiled
     current = 0.0
-    if var == "reputation":
-        if Disposition in player.components:
-            current = player.components[Disposition].reputation
-    elif var == "stress":
-        if Stress in player.components:
-            current = player.components[Stress].stress_level
+    if comp_type is not None:
+        comp = player.components.get(comp_type)
+        if comp is not None:
+            current = getattr(comp, field_name)
             
-    if op == "<": return current < threshold
-    if op == ">": return current > threshold
-    if op == "==": return current == threshold
-    
-    return True
+    return op(current, threshold)
 
 def spawn_from_definition(registry: tcod.ecs.Registry, spawn_def: Dict[str, Any], x: int, y: int, faction_id: Optional[str] = None) -> Optional[tcod.ecs.Entity]:
     """Executes a spawn based on a dictionary definition."""
@@ -230,8 +244,12 @@ def spawn_bespoke_chunk(registry: tcod.ecs.Registry, chunk_data: Dict[str, Any])
         
     chunk_data["is_spawned"] = True
 
-def spawn_wilderness_chunk(registry: tcod.ecs.Registry, chunk_data: Dict[str, Any]):
-    """Spawns ambient NPCs in a wilderness chunk."""
+def spawn_wilderness_chunk(registry: tcod.ecs.Registry, chunk_data: Dict[str, Any],
+                           rng: Optional[random.Random] = None):
+    """
+    Spawns ambient NPCs in a wilderness chunk.
+    rng defaults to one seeded from the chunk coords, so a chunk always rolls the same pack.
+    """
     if chunk_data.get("is_spawned"):
         return
         
@@ -245,7 +263,8 @@ def spawn_wilderness_chunk(registry: tcod.ecs.Registry, chunk_data: Dict[str, An
     global_off_x = chunk_x * chunk_size
     global_off_y = chunk_y * chunk_size
     
-    rng = random.Random(hash((chunk_x, chunk_y, 12345)))
+    if rng is None:
+        rng = random.Random(hash((chunk_x, chunk_y, 12345)))
     if rng.random() < 0.15:
         pack_size = rng.randint(1, 3)
         ids = [entry.id for entry in pop_entries]
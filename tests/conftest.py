@@ -0,0 +1,108 @@
+import pytest
+
+# Imported before test modules so their "mock pydantic if missing" guards see the real one
+from engine.data_loader import (
+    get_ability_def, get_entity_def, get_item_def, get_starting_rumors, get_affixes,
+    get_biome_defs, get_module_defs, get_population_defs
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_data_loader():
+    """Parse the commonly used TOML defs once so no single test pays the cold load."""
+    get_ability_def("basic_attack")
+    for entity_id in ("hero_standard", "foe_skirmisher"):
+        get_entity_def(entity_id)
+    for item_path in ("weapons/iron_sword", "consumables/strength_potion", "consumables/healing_potion"):
+        get_item_def(item_path)
+    get_starting_rumors()
+    get_affixes()
+    # Parsed on every SimulationLoop() via ChunkManager
+    get_biome_defs()
+    get_module_defs()
+    get_population_defs()
+
+
+@pytest.fixture(scope="session")
+def bespoke_chunk_finder():
+    """
+    find(world, size=40) -> bespoke (settlement) chunk coords in the [0, size)
+    square, row-major, via ChunkManager.find_settlements. Memoized per world and
+    territory seed for the session (territory captures are not part of the key).
+    """
+    found = {}
+
+    def _find(world, size=40):
+        key = (world.world_seed, world.territory.world_seed if world.territory else None, size)
+        if key not in found:
+            found[key] = world.find_settlements(0, 0, size, size)
+        return found[key]
+    return _find
+
+
+@pytest.fixture
+def registry():
+    """Empty tcod.ecs.Registry for tests that exercise systems without a SimulationLoop."""
+    import tcod.ecs
+    return tcod.ecs.Registry()
+
+
+@pytest.fixture
+def sim(tmp_path):
+    """Fresh SimulationLoop whose chronicle lives in the per-test tmp_path."""
+    from engine.loop import SimulationLoop
+    return SimulationLoop(chronicle_path=tmp_path / "chronicle.jsonl")
+
+
+@pytest.fixture
+def memory_sim():
+    """
+    SimulationLoop whose chronicle goes to an io.StringIO (sim.inscriber.chronicle_stream),
+    so tick-heavy tests do no file I/O.
+    """
+    import io
+    from engine.loop import SimulationLoop
+    return SimulationLoop(chronicle_stream=io.StringIO())
+
+
+@pytest.fixture
+def fake_item_factory(monkeypatch):
+    """
+    Stand-in for engine.item_factory.create_item that builds a bare hand-slot
+    item (no TOML lookup, no affix rolls). Use it where only "some equippable
+    item" matters; tests of the real factory should keep calling create_item.
+    """
+    from engine.ecs.components import ItemIdentity, Equippable
+
+    def _fake(registry, item_path):
+        item_id = item_path.split("/")[-1]
+        entity = registry.new_entity()
+        entity.components[ItemIdentity] = ItemIdentity(entity_id=item_id, name=item_id, description="")
+        entity.components[Equippable] = Equippable(slot_type="hand")
+        return entity
+
+    monkeypatch.setattr("engine.item_factory.create_item", _fake)
+    return _fake
+
+
+@pytest.fixture
+def make_hero(sim):
+    """
+    Builds the standard test hero (player "Aric" at 5,5 with 100 AP) in sim.registry.
+    Components passed in replace the prototype's component of the same type.
+    """
+    import copy
+    from engine.ecs.components import EntityIdentity, Position, ActionEconomy
+
+    proto = {
+        EntityIdentity: EntityIdentity(entity_id=1, name="Aric", archetype="Standard", is_player=True),
+        Position: Position(x=5, y=5),
+        ActionEconomy: ActionEconomy(ap_pool=100),
+    }
+
+    def _make(*components):
+        hero = sim.registry.new_entity()
+        parts = {**proto, **{type(c): c for c in components}}
+        hero.components.update({k: copy.deepcopy(v) for k, v in parts.items()})
+        return hero
+    return _make
@@ -33,6 +33,23 @@ def test_get_desire_map_weighting():
     d_map_friendly = ai_sys.get_desire_map(friendly)
     assert d_map_friendly[9, 9] > d_map_friendly[0, 0] # Hotter at ally
 
+def test_desire_window_matches_map():
+    registry = tcod.ecs.Registry()
+    ai_sys = InfluenceMapSystem(width=10, height=10)
+    enemy = registry.new_entity()
+    enemy.components[Position] = Position(x=3, y=7)
+    enemy.components[Disposition] = Disposition(reputation=-1.0)
+    ai_sys.update(registry, center_x=5, center_y=5)
+
+    profile = BehaviorProfile(threat_weight=1.0, affinity_weight=0.5)
+    d_map = ai_sys.get_desire_map(profile)
+    np.testing.assert_array_equal(ai_sys.get_desire_window(profile, 4, 4), d_map[3:6, 3:6])
+
+    # Corner: off-map cells are -inf, in-map cells still match
+    corner = ai_sys.get_desire_window(profile, 0, 0)
+    assert np.isneginf(corner[0]).all() and np.isneginf(corner[:, 0]).all()
+    np.testing.assert_array_equal(corner[1:, 1:], d_map[0:2, 0:2])
+
 def test_influence_map_generation():
     registry = tcod.ecs.Registry()
     ai_sys = InfluenceMapSystem(width=10, height=10)
@@ -81,3 +98,11 @@ def test_influence_map_normalization():
     # Distance from 0,0 to 5,5 is 5. Distance from 9,9 to 5,5 is 4.
     # Min dist is 4. 4/9 = 0.444
     assert 0.4 < val_mid < 0.5
+
+def test_broadcast_distance_matches_dijkstra(monkeypatch):
+    ai_sys = InfluenceMapSystem(width=12, height=9)
+    seeds = [(0, 0), (8, 11), (4, 5), (-1, 3), (20, 20)] # (y, x); last two off-map
+    fast = ai_sys._compute_normalized_dijkstra(seeds)
+    monkeypatch.setattr("engine.ai_system.BROADCAST_SEED_LIMIT", 0)
+    slow = ai_sys._compute_normalized_dijkstra(seeds)
+    np.testing.assert_array_equal(fast, slow)
@@ -0,0 +1,26 @@
+import pytest
+
+from engine.chronicle import ChronicleInscriber, ChronicleReader, GameTimestamp
+from engine.combat import CombatEvent, EventBus, EVT_ON_DEATH
+
+
+@pytest.mark.parametrize("mode", ["sync", "async"])
+def test_inscriber_modes_write_in_order(tmp_path, mode):
+    path = tmp_path / "chronicle.jsonl"
+    bus = EventBus()
+    inscriber = ChronicleInscriber(bus=bus, chronicle_path=path,
+                                   clock=GameTimestamp(era="Recent", cycle=1, tick=1), mode=mode)
+    inscriber.open_session()
+    for i in range(20):
+        bus.emit(CombatEvent(event_key=EVT_ON_DEATH, source=f"Actor_{i}", data={"final_hp": 0}))
+    inscriber.close_session()
+
+    handles = [e["actor_handle"] for e in ChronicleReader(path).all_entries()]
+    assert handles == ["system"] + [f"Actor_{i}" for i in range(20)] + ["system"]
+    assert inscriber._writer is None  # close_session flushed and stopped the writer
+
+
+def test_inscriber_rejects_unknown_mode(tmp_path):
+    with pytest.raises(ValueError):
+        ChronicleInscriber(bus=EventBus(), chronicle_path=tmp_path / "c.jsonl",
+                           clock=GameTimestamp(era="Recent", cycle=1, tick=1), mode="fast")
@@ -4,16 +4,19 @@ import sys
 try:
     import pydantic
 except ImportError:
-    from unittest.mock import MagicMock
-    mock_pydantic = MagicMock()
+    import types
     class MockBaseModel:
+        __slots__ = ("__dict__",)  # arbitrary attrs, no validation
         def __init__(self, **kwargs):
-            for k, v in kwargs.items():
-                setattr(self, k, v)
-    mock_pydantic.BaseModel = MockBaseModel
-    sys.modules['pydantic'] = mock_pydantic
+            self.__dict__.update(kwargs)
+    sys.modules['pydantic'] = types.SimpleNamespace(
+        BaseModel=MockBaseModel,
+        Field=lambda *args, **kwargs: kwargs["default_factory"]() if "default_factory" in kwargs else None,
+        field_validator=lambda *args, **kwargs: lambda f: f,
+    )
 
 import unittest
+from collections import defaultdict
 from engine.combat import (
     Combatant,
     EventBus,
@@ -26,12 +29,12 @@ class TestCombatantDamage(unittest.TestCase):
     def setUp(self):
         self.bus = EventBus()
         self.emitted_events = []
+        self.events_by_key = defaultdict(list)
 
         # Capture all events
-        def capture_event(event):
-            self.emitted_events.append(event)
-
-        self.bus.subscribe("*", capture_event)
+        self.bus.subscribe("*", self.emitted_events.append)
+        # Bucket events per key so assertions don't re-filter the full log
+        self.bus.subscribe("*", lambda e: self.events_by_key[e.event_key].append(e))
 
         self.combatant = Combatant(
             name="Target dummy",
@@ -65,7 +68,7 @@ class TestCombatantDamage(unittest.TestCase):
         damage_amount = 20
         self.combatant.apply_damage(damage_amount)
 
-        on_damage_events = [e for e in self.emitted_events if e.event_key == EVT_ON_DAMAGE]
+        on_damage_events = self.events_by_key[EVT_ON_DAMAGE]
         self.assertEqual(len(on_damage_events), 1)
 
         event = on_damage_events[0]
@@ -75,8 +78,7 @@ class TestCombatantDamage(unittest.TestCase):
         self.assertEqual(event.data["hp_remaining"], 30)
 
         # Verify no death event was emitted since it didn't drop to 0
-        death_events = [e for e in self.emitted_events if e.event_key == EVT_ON_DEATH]
-        self.assertEqual(len(death_events), 0)
+        self.assertEqual(len(self.events_by_key[EVT_ON_DEATH]), 0)
 
     def test_apply_damage_lethal_emits_death_and_stress(self):
         """Test that lethal damage emits EVT_ON_DEATH and EVT_SOCIAL_STRESS_SPIKE."""
@@ -86,12 +88,12 @@ class TestCombatantDamage(unittest.TestCase):
         self.assertTrue(self.combatant.is_dead)
         self.assertEqual(self.combatant.hp, -10)
 
-        death_events = [e for e in self.emitted_events if e.event_key == EVT_ON_DEATH]
+        death_events = self.events_by_key[EVT_ON_DEATH]
         self.assertEqual(len(death_events), 1)
         self.assertEqual(death_events[0].source, self.combatant.name)
         self.assertEqual(death_events[0].data["final_hp"], -10)
 
-        stress_events = [e for e in self.emitted_events if e.event_key == EVT_SOCIAL_STRESS_SPIKE]
+        stress_events = self.events_by_key[EVT_SOCIAL_STRESS_SPIKE]
         self.assertEqual(len(stress_events), 1)
         self.assertEqual(stress_events[0].source, self.combatant.name)
         self.assertEqual(stress_events[0].data["cause"], "combat_death")
@@ -101,7 +103,7 @@ class TestCombatantDamage(unittest.TestCase):
         """Test that passing a specific bus overrides the registered bus."""
         explicit_bus = EventBus()
         explicit_events = []
-        explicit_bus.subscribe("*", lambda e: explicit_events.append(e))
+        explicit_bus.subscribe("*", explicit_events.append)
 
         self.combatant.apply_damage(10, bus=explicit_bus)
 
@@ -7,14 +7,16 @@ import sys
 try:
     import pydantic
 except ImportError:
-    from unittest.mock import MagicMock
-    mock_pydantic = MagicMock()
+    import types
     class MockBaseModel:
+        __slots__ = ("__dict__",)  # arbitrary attrs, no validation
         def __init__(self, **kwargs):
-            for k, v in kwargs.items():
-                setattr(self, k, v)
-    mock_pydantic.BaseModel = MockBaseModel
-    sys.modules['pydantic'] = mock_pydantic
+            self.__dict__.update(kwargs)
+    sys.modules['pydantic'] = types.SimpleNamespace(
+        BaseModel=MockBaseModel,
+        Field=lambda *args, **kwargs: kwargs["default_factory"]() if "default_factory" in kwargs else None,
+        field_validator=lambda *args, **kwargs: lambda f: f,
+    )
 
 import unittest
 import io
@@ -100,5 +102,38 @@ class TestEventBus(unittest.TestCase):
 
         self.assertEqual(self.calls, ["success_1", "success_2", "fail"])
 
+    def test_subscription_changes_after_emit_take_effect(self):
+        """
+        Test that the cached dispatch list is rebuilt after subscribe/unsubscribe.
+        """
+        event = CombatEvent(event_key="test.event", source="test")
+        handler = self._success_handler_1  # unsubscribe matches by identity
+        self.bus.subscribe("test.event", handler)
+        self.bus.emit(event)
+
+        self.bus.subscribe("*", self._wildcard_handler)
+        self.bus.emit(event)
+
+        self.bus.unsubscribe("test.event", handler)
+        self.bus.emit(event)
+
+        self.assertEqual(self.calls, ["success_1", "success_1", "wildcard", "wildcard"])
+
+    def test_deferred_events_dispatch_on_drain(self):
+        """
+        Test that emit_deferred queues until drain(), which also flushes events queued mid-drain.
+        """
+        follow_up = CombatEvent(event_key="test.follow_up", source="test")
+        self.bus.subscribe("test.event", lambda e: self.bus.emit_deferred(follow_up))
+        self.bus.subscribe("*", self.calls.append)
+
+        event = CombatEvent(event_key="test.event", source="test")
+        self.bus.emit_deferred(event)
+        self.assertEqual(self.calls, [])
+
+        self.bus.drain()
+        self.assertEqual(self.calls, [event, follow_up])
+        self.assertEqual(len(self.bus.pending), 0)
+
 if __name__ == '__main__':
     unittest.main()
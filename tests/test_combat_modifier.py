@@ -6,16 +6,16 @@ import unittest
 _mocked_pydantic = False
 if 'pydantic' not in sys.modules:
     class MockBaseModel:
+        __slots__ = ("__dict__",)  # arbitrary attrs, no validation
         def __init__(self, **kwargs):
-            for k, v in kwargs.items():
-                setattr(self, k, v)
+            self.__dict__.update(kwargs)
 
     class MockField:
         pass
 
     class MockPydantic:
         BaseModel = MockBaseModel
-        Field = lambda *args, **kwargs: MockField()
+        Field = lambda *args, **kwargs: kwargs["default_factory"]() if "default_factory" in kwargs else MockField()
         field_validator = lambda *args, **kwargs: lambda f: f
 
     sys.modules['pydantic'] = MockPydantic()
@@ -0,0 +1,27 @@
+import random
+from collections import Counter
+from engine.combat import resolve_roll, roll_2d8, CRIT_THRESHOLD, FUMBLE_THRESHOLD
+
+def test_roll_2d8_covers_full_range():
+    rng_state = random.getstate()
+    random.seed(7)
+    try:
+        seen = Counter(roll_2d8() for _ in range(5000))
+    finally:
+        random.setstate(rng_state)
+    assert set(seen) == set(range(2, 17))
+    # Bell curve: 9 is the most common total
+    assert seen.most_common(1)[0][0] in (8, 9, 10)
+
+def test_resolve_roll_payload_and_advantage():
+    for _ in range(500):
+        r = resolve_roll(modifier=3, advantage=True)
+        assert len(r["rolls"]) == 2
+        assert all(2 <= x <= 16 for x in r["rolls"])
+        assert r["natural"] == max(r["rolls"])
+        assert r["total"] == r["natural"] + 3
+        assert r["is_crit"] == (r["natural"] >= CRIT_THRESHOLD)
+        assert r["is_fumble"] == (r["natural"] <= FUMBLE_THRESHOLD)
+
+    r = resolve_roll(disadvantage=True)
+    assert r["natural"] == min(r["rolls"])
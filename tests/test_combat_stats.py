@@ -4,17 +4,19 @@ import sys
 try:
     import pydantic
 except ImportError:
-    from unittest.mock import MagicMock
-    mock_pydantic = MagicMock()
+    import types
     class MockBaseModel:
+        __slots__ = ("__dict__",)  # arbitrary attrs, no validation
         def __init__(self, **kwargs):
-            for k, v in kwargs.items():
-                setattr(self, k, v)
-    mock_pydantic.BaseModel = MockBaseModel
-    sys.modules['pydantic'] = mock_pydantic
+            self.__dict__.update(kwargs)
+    sys.modules['pydantic'] = types.SimpleNamespace(
+        BaseModel=MockBaseModel,
+        Field=lambda *args, **kwargs: kwargs["default_factory"]() if "default_factory" in kwargs else None,
+        field_validator=lambda *args, **kwargs: lambda f: f,
+    )
 
 import unittest
-from engine.combat import Combatant, Modifier, EVT_TURN_ENDED
+from engine.combat import Combatant, CombatEvent, EventBus, Modifier, EVT_TURN_ENDED
 
 class TestCombatantStats(unittest.TestCase):
     def setUp(self):
@@ -98,5 +100,18 @@ class TestCombatantStats(unittest.TestCase):
         # Base 5 + 2 + 1 = 8
         self.assertEqual(self.combatant.get_stat("attack_bonus"), 8)
 
+    def test_get_stat_after_bus_expiry(self):
+        """Test that a modifier expired via the bus drops out of the stat index."""
+        bus = EventBus()
+        self.combatant.register_with_bus(bus)
+        mod = Modifier(name="Haste", stat_target="agility", value=4, expires_on=[EVT_TURN_ENDED])
+        self.combatant.add_modifier(mod)
+        self.assertEqual(self.combatant.get_stat("agility"), 19)
+
+        bus.emit(CombatEvent(event_key=EVT_TURN_ENDED, source=self.combatant.name))
+
+        self.assertNotIn(mod, self.combatant.modifiers)
+        self.assertEqual(self.combatant.get_stat("agility"), 15)
+
 if __name__ == '__main__':
     unittest.main()
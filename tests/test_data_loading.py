@@ -2,35 +2,31 @@ import tomllib
 import pytest
 from pathlib import Path
 
-def test_load_ability_toml():
-    path = Path("data/abilities/basic_attack.toml")
+@pytest.mark.parametrize("path, checks", [
+    ("data/abilities/basic_attack.toml",
+     lambda d: d["id"] == "basic_attack" and d["ap_cost"] == 10 and "effects" in d),
+    ("data/entities/hero_standard.toml",
+     lambda d: d["hp"] == 30 and d["archetype"] == "Standard" and "basic_attack" in d["abilities"]),
+    ("data/world/starting_rumors.toml",
+     lambda d: "rumors" in d and len(d["rumors"]) == 2 and d["rumors"][0]["id"] == "pol_keep"),
+], ids=["ability", "entity", "world_rumors"])
+def test_toml_schema(path, checks):
+    path = Path(path)
     assert path.exists()
-    
-    with open(path, "rb") as f:
-        data = tomllib.load(f)
-        
-    assert data["id"] == "basic_attack"
-    assert data["ap_cost"] == 10
-    assert "effects" in data
 
-def test_load_entity_toml():
-    path = Path("data/entities/hero_standard.toml")
-    assert path.exists()
-    
     with open(path, "rb") as f:
         data = tomllib.load(f)
-        
-    assert data["hp"] == 30
-    assert data["archetype"] == "Standard"
-    assert "basic_attack" in data["abilities"]
 
-def test_load_world_rumors():
-    path = Path("data/world/starting_rumors.toml")
-    assert path.exists()
-    
-    with open(path, "rb") as f:
-        data = tomllib.load(f)
-        
-    assert "rumors" in data
-    assert len(data["rumors"]) == 2
-    assert data["rumors"][0]["id"] == "pol_keep"
+    assert checks(data)
+
+@pytest.mark.parametrize("loader, args", [
+    ("get_ability_def", ("basic_attack",)),
+    ("get_entity_def", ("hero_standard",)),
+    ("get_starting_rumors", ()),
+], ids=["ability", "entity", "rumors"])
+def test_loader_is_memoized(loader, args):
+    # Hot paths (invoke_ability_ecs, spawners, session setup) call these repeatedly;
+    # only the first call may parse TOML
+    import engine.data_loader as data_loader
+    fn = getattr(data_loader, loader)
+    assert fn(*args) is fn(*args)
@@ -1,24 +1,27 @@
 import tcod.ecs
 import pytest
-from engine.ecs.components import ActionEconomy, MovementStats, CombatStats, ItemStats
+from engine.ecs.components import ActionEconomy, MovementStats, CombatStats, ItemStats, Anatomy, Equippable
 from engine.combat import EventBus, EVT_TURN_STARTED, EVT_ACTION_RESOLVED, ENERGY_THRESHOLD, AP_POOL_SIZE
-from engine.ecs.systems import turn_resolution_system, action_economy_reset_system, action_resolution_system, get_effective_stats
+from engine.ecs.systems import turn_resolution_system, action_economy_reset_system, action_resolution_system, get_effective_stats, equip_item_system
 
 def test_turn_resolution():
     registry = tcod.ecs.Registry()
     actor = registry.new_entity()
     actor.components[ActionEconomy] = ActionEconomy(action_energy=0.0)
     actor.components[MovementStats] = MovementStats(speed=10.0)
-    turn_resolution_system(registry)
+    assert turn_resolution_system(registry) is False
     assert actor.components[ActionEconomy].action_energy == 10.0
 
+    actor.components[ActionEconomy].action_energy = ENERGY_THRESHOLD - 10.0
+    assert turn_resolution_system(registry) is True
+
 def test_ap_reset_on_energy_threshold():
     registry = tcod.ecs.Registry()
     bus = EventBus()
     actor = registry.new_entity()
     actor.components[ActionEconomy] = ActionEconomy(action_energy=ENERGY_THRESHOLD, ap_pool=0)
     events = []
-    bus.subscribe(EVT_TURN_STARTED, lambda e: events.append(e))
+    bus.subscribe(EVT_TURN_STARTED, events.append)
     action_economy_reset_system(registry, bus)
     assert actor.components[ActionEconomy].ap_pool == AP_POOL_SIZE
     assert len(events) == 1
@@ -29,7 +32,7 @@ def test_action_resolution_attack_success():
     actor = registry.new_entity()
     actor.components[ActionEconomy] = ActionEconomy(ap_pool=100)
     events = []
-    bus.subscribe(EVT_ACTION_RESOLVED, lambda e: events.append(e))
+    bus.subscribe(EVT_ACTION_RESOLVED, events.append)
     # MUST provide a valid TOML ability id (e.g. "basic_attack")
     action_resolution_system(registry, actor, "basic_attack", {"target": "Foe"}, bus)
     assert actor.components[ActionEconomy].ap_pool == 90
@@ -51,3 +54,46 @@ def test_get_effective_stats_aggregation():
     assert effective.attack_bonus == 7 # 5 base + 2 item
     assert effective.defense_bonus == 14 # 10 base + 4 protection
     assert effective.damage_bonus == 5 # 2 base + 3 item
+
+def test_get_effective_stats_cache_invalidation():
+    registry = tcod.ecs.Registry()
+    actor = registry.new_entity()
+    actor.components[CombatStats] = CombatStats(attack_bonus=5)
+    actor.components[Anatomy] = Anatomy()
+
+    first = get_effective_stats(actor)
+    assert get_effective_stats(actor) is first # memoized
+
+    # Equipping through the system drops the cache
+    item = registry.new_entity()
+    item.components[ItemStats] = ItemStats(attack_bonus=2)
+    item.components[Equippable] = Equippable(slot_type="hand")
+    actor.relation_tags_many["IsCarrying"].add(item)
+    assert equip_item_system(actor, item)
+    assert get_effective_stats(actor).attack_bonus == 7
+
+    # Replacing base stats drops it too
+    actor.components[CombatStats] = CombatStats(attack_bonus=1)
+    assert get_effective_stats(actor).attack_bonus == 3
+
+    # Dropping an equipped item is the unequip path
+    from engine.ecs.components import Position
+    from engine.ecs.systems import drop_item_system
+    actor.components[Position] = Position(x=0, y=0)
+    assert drop_item_system(actor, item)
+    assert get_effective_stats(actor).attack_bonus == 1
+
+def test_get_player_follows_identity():
+    from engine.ecs.components import EntityIdentity
+    from engine.ecs.systems import get_player
+    registry = tcod.ecs.Registry()
+    npc = registry.new_entity()
+    npc.components[EntityIdentity] = EntityIdentity(entity_id=2, name="NPC", archetype="Standard")
+    assert get_player(registry) is None
+
+    hero = registry.new_entity()
+    hero.components[EntityIdentity] = EntityIdentity(entity_id=1, name="Aric", archetype="Standard", is_player=True)
+    assert get_player(registry) is hero
+
+    hero.components[EntityIdentity] = EntityIdentity(entity_id=1, name="Aric", archetype="Standard", is_player=False)
+    assert get_player(registry) is None
@@ -1,5 +1,6 @@
+import numpy as np
 import pytest
-from engine.equilibrium import compute_migration_risk
+from engine.equilibrium import compute_migration_risk, compute_migration_risk_batch
 
 def test_migration_risk_flourishing():
     # living_count = 10, vitality = 0.8
@@ -18,3 +19,9 @@ def test_migration_risk_empty_node():
     # taper_threshold = 40 + (0 * 0.5) = 40
     # risk = 100 - 40 = 60
     assert compute_migration_risk(living_count=0, vitality=0.5) == 60
+
+def test_migration_risk_batch_matches_scalar():
+    counts = np.array([10, 5, 0, 3])
+    vitality = np.array([0.8, -0.5, 0.5, -2.0])
+    expected = [compute_migration_risk(c, v) for c, v in zip(counts.tolist(), vitality.tolist())]
+    assert compute_migration_risk_batch(counts, vitality).tolist() == expected
@@ -15,9 +15,7 @@ def test_exploration_persistence():
     em.mark_explored(-1, 2)
     
     state = em.get_state()
-    assert "tiles" in state
-    assert "5_5" in state["tiles"]
-    assert "-1_2" in state["tiles"]
+    assert isinstance(state["tiles_bin"], str)  # JSON-safe
     
     em2 = ExplorationManager()
     em2.load_state(state)
@@ -30,3 +28,45 @@ def test_exploration_invalid_load():
     # Should not crash on malformed data
     em.load_state({"tiles": ["invalid", "1_2_3", None]})
     assert len(em.explored_tiles) == 0
+    em.load_state({"tiles_bin": "not base64!"})
+    assert len(em.explored_tiles) == 0
+
+def test_exploration_legacy_tiles_load():
+    em = ExplorationManager()
+    em.load_state({"tiles": ["5_5", "-1_2"]})
+    assert em.is_explored(5, 5) is True
+    assert em.is_explored(-1, 2) is True
+
+def test_exploration_negative_coords_distinct():
+    em = ExplorationManager()
+    em.mark_explored(-1, 0)
+    assert em.is_explored(0, -1) is False
+    assert em.is_explored(-1, -1) is False
+    em.mark_explored(-7, -3)
+    em2 = ExplorationManager()
+    em2.load_state(em.get_state())
+    assert em2.is_explored(-7, -3) is True
+
+def test_exploration_block_matches_per_tile():
+    import numpy as np
+    em = ExplorationManager()
+    mask = np.zeros((4, 6), dtype=bool)
+    mask[0, 0] = mask[3, 5] = mask[1, 2] = True
+    em.mark_explored_block(-3, -1, mask)
+    assert em.is_explored(-3, -1) and em.is_explored(2, 2) and em.is_explored(-1, 0)
+    assert len(em.explored_tiles) == 3
+    assert (em.explored_block(-3, -1, 6, 4) == mask).all()
+
+def test_explored_block_follows_outside_changes():
+    # explored_block reads a dense mirror; it must notice tiles that bypass mark_explored*
+    em = ExplorationManager()
+    em.mark_explored(70, -3)
+    assert em.explored_block(60, -10, 20, 20).sum() == 1
+    em.explored_tiles.add(0)  # packed (0, 0)
+    assert em.explored_block(-5, -5, 10, 10)[5, 5]
+
+    other = ExplorationManager()
+    other.mark_explored(-100, 200)
+    em.load_state(other.get_state())
+    assert em.explored_block(-110, 190, 20, 20).sum() == 1
+    assert not em.explored_block(60, -10, 20, 20).any()
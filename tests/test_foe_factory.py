@@ -4,14 +4,16 @@ import sys
 try:
     import pydantic
 except ImportError:
-    from unittest.mock import MagicMock
-    mock_pydantic = MagicMock()
+    import types
     class MockBaseModel:
+        __slots__ = ("__dict__",)  # arbitrary attrs, no validation
         def __init__(self, **kwargs):
-            for k, v in kwargs.items():
-                setattr(self, k, v)
-    mock_pydantic.BaseModel = MockBaseModel
-    sys.modules['pydantic'] = mock_pydantic
+            self.__dict__.update(kwargs)
+    sys.modules['pydantic'] = types.SimpleNamespace(
+        BaseModel=MockBaseModel,
+        Field=lambda *args, **kwargs: kwargs["default_factory"]() if "default_factory" in kwargs else None,
+        field_validator=lambda *args, **kwargs: lambda f: f,
+    )
 
 import unittest
 from engine.combat import FoeFactory
@@ -67,5 +69,21 @@ class TestFoeFactorySecurity(unittest.TestCase):
         finally:
             FoeFactory.ARCHETYPES = original_archetypes
 
+    def test_replaced_archetype_is_respecialized(self):
+        """Test that a cached generator is rebuilt when its archetype template is replaced."""
+        original_archetypes = dict(FoeFactory.ARCHETYPES)
+        try:
+            FoeFactory.ARCHETYPES["Shifting"] = {
+                "hp_mult": 1.0, "atk_bonus": 0, "def_bonus": 0, "dmg_bonus": 0, "speed": 10.0
+            }
+            self.assertEqual(FoeFactory.generate(threat_level=0, archetype="Shifting").max_hp, 10)
+
+            FoeFactory.ARCHETYPES["Shifting"] = {
+                "hp_mult": 2.0, "atk_bonus": 0, "def_bonus": 0, "dmg_bonus": 0, "speed": 10.0
+            }
+            self.assertEqual(FoeFactory.generate(threat_level=0, archetype="Shifting").max_hp, 20)
+        finally:
+            FoeFactory.ARCHETYPES = original_archetypes
+
 if __name__ == '__main__':
     unittest.main()
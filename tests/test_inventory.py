@@ -36,6 +36,23 @@ def test_pickup_item_removes_position():
     assert Position not in item.components
     assert item in actor.relation_tags_many["IsCarrying"]
 
+def test_inventory_count_and_iter_carried():
+    from engine.ecs.systems import pickup_item_system, inventory_count, iter_carried
+    from engine.ecs.components import Position
+
+    registry = tcod.ecs.Registry()
+    actor = registry.new_entity()
+    actor.components[Position] = Position(0, 0)
+    assert inventory_count(actor) == 0
+
+    items = [registry.new_entity() for _ in range(2)]
+    for item in items:
+        item.components[Position] = Position(0, 0)
+        pickup_item_system(actor, item)
+
+    assert inventory_count(actor) == 2
+    assert set(iter_carried(actor)) == set(items)
+
 def test_drop_item_adds_position():
     from engine.ecs.systems import pickup_item_system, drop_item_system
     from engine.ecs.components import Position
@@ -4,10 +4,8 @@ Covers: new weapon/armor blueprints, affix tag matching, EntityDef.tags, and
         the select_affixes variable-name fix.
 """
 import pytest
-import tcod.ecs
-from unittest.mock import patch
 
-from engine.data_loader import get_item_def, get_entity_def, get_affixes, AffixDef
+from engine.data_loader import get_item_def, get_entity_def, get_affixes, get_affix_def, AffixDef
 from engine.item_factory import create_item, select_affixes
 from engine.ecs.components import ItemIdentity, ItemStats, Equippable
 
@@ -70,36 +68,36 @@ class TestNewAffixes:
             assert expected in ids, f"Affix '{expected}' not found"
 
     def test_vicious_is_prefix_for_weapons(self):
-        affixes = {a.id: a for a in get_affixes()}
-        a = affixes["vicious"]
+        a = get_affix_def("vicious")
         assert a.type == "prefix"
         assert "weapon" in a.eligible_tags
         assert a.item_stats["damage_bonus"] == 3
 
     def test_swift_has_speed_modifier(self):
-        affixes = {a.id: a for a in get_affixes()}
-        a = affixes["swift"]
+        a = get_affix_def("swift")
         assert any(m["stat_field"] == "speed" for m in a.modifiers)
 
     def test_of_warding_is_suffix_for_armor(self):
-        affixes = {a.id: a for a in get_affixes()}
-        a = affixes["of_warding"]
+        a = get_affix_def("of_warding")
         assert a.type == "suffix"
         assert "armor" in a.eligible_tags
 
     def test_runed_eligible_for_weapon_and_armor(self):
-        affixes = {a.id: a for a in get_affixes()}
-        a = affixes["runed"]
+        a = get_affix_def("runed")
         assert "weapon" in a.eligible_tags
         assert "armor" in a.eligible_tags
 
     def test_of_flames_has_both_stats_and_modifier(self):
-        affixes = {a.id: a for a in get_affixes()}
-        a = affixes["of_flames"]
+        a = get_affix_def("of_flames")
         assert a.item_stats["damage_bonus"] == 2
         assert len(a.modifiers) == 1
         assert a.modifiers[0]["id"] == "burning"
 
+    def test_affix_lookup_by_id(self):
+        assert get_affix_def("vicious") is next(a for a in get_affixes() if a.id == "vicious")
+        with pytest.raises(KeyError):
+            get_affix_def("no_such_affix")
+
 
 # ---------------------------------------------------------------------------
 # select_affixes correctness (the e→a bug fix)
@@ -118,6 +116,12 @@ class TestSelectAffixes:
         assert len(results) == 1
         assert all("armor" in a.eligible_tags for a in results)
 
+    def test_tag_index_matches_linear_scan(self):
+        from engine.data_loader import get_affixes_for_tags
+        for tags in ({"weapon"}, {"armor", "jewelry"}, {"is_part"}, set()):
+            expected = [a for a in get_affixes() if any(t in tags for t in a.eligible_tags)]
+            assert get_affixes_for_tags(tags) == expected
+
     def test_no_match_returns_empty(self):
         results = select_affixes({"is_part", "is_blade"}, count=1)
         assert results == []
@@ -135,41 +139,49 @@ class TestSelectAffixes:
 # ---------------------------------------------------------------------------
 
 class TestCreateItemVariants:
-    def setup_method(self):
-        self.registry = tcod.ecs.Registry()
+    @pytest.fixture(autouse=True)
+    def _registry(self, registry):
+        self.registry = registry
+
+    @pytest.fixture
+    def rarity(self, monkeypatch):
+        """Pins roll_rarity: call with the tier the next create_item should roll."""
+        def _pin(tier):
+            monkeypatch.setattr("engine.item_factory.roll_rarity", lambda: tier)
+        return _pin
 
     def test_iron_dagger_entity_created(self):
         entity = create_item(self.registry, "weapons/iron_dagger")
         ident = entity.components[ItemIdentity]
         assert "Dagger" in ident.name or "iron_dagger" in ident.entity_id
 
-    def test_war_axe_entity_has_stats(self):
-        with patch("engine.item_factory.roll_rarity", return_value="common"):
-            entity = create_item(self.registry, "weapons/war_axe")
+    def test_war_axe_entity_has_stats(self, rarity):
+        rarity("common")
+        entity = create_item(self.registry, "weapons/war_axe")
         stats = entity.components[ItemStats]
         assert stats.damage_bonus == 6
 
-    def test_leather_vest_entity_equippable(self):
-        with patch("engine.item_factory.roll_rarity", return_value="common"):
-            entity = create_item(self.registry, "armor/leather_vest")
+    def test_leather_vest_entity_equippable(self, rarity):
+        rarity("common")
+        entity = create_item(self.registry, "armor/leather_vest")
         eq = entity.components[Equippable]
         assert eq.slot_type == "torso"
 
-    def test_iron_shield_protection(self):
-        with patch("engine.item_factory.roll_rarity", return_value="common"):
-            entity = create_item(self.registry, "armor/iron_shield")
+    def test_iron_shield_protection(self, rarity):
+        rarity("common")
+        entity = create_item(self.registry, "armor/iron_shield")
         stats = entity.components[ItemStats]
         assert stats.protection == 4
 
-    def test_magic_weapon_gets_affix_applied(self):
+    def test_magic_weapon_gets_affix_applied(self, rarity, monkeypatch):
         mock_affix = AffixDef(
             id="vicious", name="Vicious", type="prefix",
             eligible_tags=["weapon"], weight=8,
             item_stats={"damage_bonus": 3, "attack_bonus": 1}
         )
-        with patch("engine.item_factory.roll_rarity", return_value="magic"):
-            with patch("engine.item_factory.select_affixes", return_value=[mock_affix]):
-                entity = create_item(self.registry, "weapons/war_axe")
+        rarity("magic")
+        monkeypatch.setattr("engine.item_factory.select_affixes", lambda tags, count: [mock_affix])
+        entity = create_item(self.registry, "weapons/war_axe")
         ident = entity.components[ItemIdentity]
         assert ident.name.startswith("Vicious")
         stats = entity.components[ItemStats]
@@ -177,15 +189,15 @@ class TestCreateItemVariants:
         assert stats.damage_bonus == 9
         assert stats.attack_bonus == 2
 
-    def test_magic_armor_gets_warding_affix(self):
+    def test_magic_armor_gets_warding_affix(self, rarity, monkeypatch):
         mock_affix = AffixDef(
             id="of_warding", name="of Warding", type="suffix",
             eligible_tags=["armor"], weight=9,
             item_stats={"protection": 3}
         )
-        with patch("engine.item_factory.roll_rarity", return_value="magic"):
-            with patch("engine.item_factory.select_affixes", return_value=[mock_affix]):
-                entity = create_item(self.registry, "armor/leather_vest")
+        rarity("magic")
+        monkeypatch.setattr("engine.item_factory.select_affixes", lambda tags, count: [mock_affix])
+        entity = create_item(self.registry, "armor/leather_vest")
         ident = entity.components[ItemIdentity]
         assert ident.name.endswith("of Warding")
         stats = entity.components[ItemStats]
@@ -1,10 +1,10 @@
 import pytest
 import tcod.ecs
 from engine.loop import SimulationLoop
+from engine.ecs.systems import find_entity_by_name
 from engine.ecs.components import EntityIdentity, Position, CombatVitals
 
-def test_jit_culling_and_materialization():
-    sim = SimulationLoop()
+def test_jit_culling_and_materialization(sim):
     sim.world.world_seed = 12345
     
     # 1. Setup Player
@@ -48,18 +48,13 @@ def test_jit_culling_and_materialization():
     sim.move_entity_ecs(hero, -95, 0)
     
     # Verify NPC is restored
-    found_npc = None
-    for ent in sim.registry.Q.all_of(components=[EntityIdentity]):
-        if ent.components[EntityIdentity].name == "Persistent Borzai":
-            found_npc = ent
-            break
+    found_npc = find_entity_by_name(sim.registry, "Persistent Borzai")
             
     assert found_npc is not None
     assert found_npc.components[CombatVitals].hp == 50
     assert (0, 0) not in sim.virtual_entities # Should be cleared from virtual store
 
-def test_jit_restores_damaged_mobs():
-    sim = SimulationLoop()
+def test_jit_restores_damaged_mobs(sim):
     sim.world.world_seed = 12345
     
     # Setup Player
@@ -85,10 +80,6 @@ def test_jit_restores_damaged_mobs():
     sim.move_entity_ecs(hero, -100, 0)
     
     # Verify restoration
-    found_mob = None
-    for ent in sim.registry.Q.all_of(components=[EntityIdentity]):
-        if ent.components[EntityIdentity].name == "Damaged Mob":
-            found_mob = ent
-            break
+    found_mob = find_entity_by_name(sim.registry, "Damaged Mob")
     assert found_mob is not None
     assert found_mob.components[CombatVitals].hp == 5
@@ -2,10 +2,9 @@ import pytest
 import tcod.ecs
 from engine.loop import SimulationLoop
 from engine.ecs.components import EntityIdentity, Position, CombatVitals, PartyMember, BehaviorProfile
-from engine.ecs.systems import recruit_npc_system
+from engine.ecs.systems import recruit_npc_system, find_entity_by_name
 
-def test_recruitment_logic():
-    sim = SimulationLoop()
+def test_recruitment_logic(sim):
     
     # Setup Player
     player = sim.registry.new_entity()
@@ -31,8 +30,7 @@ def test_recruitment_logic():
     assert npc.components[BehaviorProfile].affinity_weight == 2.0
     assert npc.components[BehaviorProfile].threat_weight == 0.0
 
-def test_party_persistence():
-    sim = SimulationLoop()
+def test_party_persistence(sim, tmp_path):
     sim.world.world_seed = 12345
     
     # Setup and recruit
@@ -48,23 +46,16 @@ def test_party_persistence():
     recruit_npc_system(player, npc)
     
     # Save
-    import tempfile
-    from pathlib import Path
-    with tempfile.TemporaryDirectory() as tmpdir:
-        snap_path = Path(tmpdir) / "snap.json"
-        sim.save_session(snapshot_path=snap_path)
-        
-        # Resume in new loop
-        sim2 = SimulationLoop()
-        sim2.resume_session(snapshot_path=snap_path)
-        
-        # Find restored NPC
-        restored_npc = None
-        for ent in sim2.registry.Q.all_of(components=[EntityIdentity]):
-            if ent.components[EntityIdentity].name == "Companion":
-                restored_npc = ent
-                break
-        
-        assert restored_npc is not None
-        assert PartyMember in restored_npc.components
-        assert restored_npc.components[PartyMember].leader_id == 1
+    snap_path = tmp_path / "snap.json"
+    sim.save_session(snapshot_path=snap_path)
+    
+    # Resume in new loop
+    sim2 = SimulationLoop(chronicle_path=tmp_path / "chronicle2.jsonl")
+    sim2.resume_session(snapshot_path=snap_path)
+    
+    # Find restored NPC
+    restored_npc = find_entity_by_name(sim2.registry, "Companion")
+    
+    assert restored_npc is not None
+    assert PartyMember in restored_npc.components
+    assert restored_npc.components[PartyMember].leader_id == 1
@@ -0,0 +1,58 @@
+import tcod.ecs
+from engine.ecs.components import Position
+from engine.ecs.spatial import PositionBuffer
+
+def _spawn(registry, x, y):
+    ent = registry.new_entity()
+    ent.components[Position] = Position(x=x, y=y)
+    return ent
+
+def test_from_registry_and_chebyshev_query():
+    registry = tcod.ecs.Registry()
+    near = _spawn(registry, 5, 5)
+    diag = _spawn(registry, 6, 6)
+    far = _spawn(registry, 9, 5)
+
+    buf = PositionBuffer.from_registry(registry)
+    assert len(buf) == 3
+    assert set(buf.entities_within(5, 5, 1)) == {near, diag}
+    assert far in buf.entities_within(5, 5, 4)
+
+def test_move_and_remove_keep_index_consistent():
+    registry = tcod.ecs.Registry()
+    a = _spawn(registry, 0, 0)
+    b = _spawn(registry, 10, 10)
+    c = _spawn(registry, 20, 20)
+    buf = PositionBuffer.from_registry(registry)
+
+    buf.move(a, 19, 19)
+    buf.remove(b)
+    assert len(buf) == 2
+    assert set(buf.entities_within(20, 20, 1)) == {a, c}
+    assert buf.index_of(b) is None
+
+    d = registry.new_entity()
+    buf.add(d, -3, -3)
+    assert buf.entities_within(-3, -3, 0) == [d]
+
+def test_in_rect_mask():
+    registry = tcod.ecs.Registry()
+    inside = _spawn(registry, 2, 3)
+    _spawn(registry, 10, 3)
+    buf = PositionBuffer.from_registry(registry)
+    mask = buf.in_rect(0, 0, 10, 10)
+    assert [buf.entities[i] for i in mask.nonzero()[0]] == [inside]
+
+def test_from_registry_component_filter_keeps_columns_aligned():
+    from engine.ecs.components import EntityIdentity
+    registry = tcod.ecs.Registry()
+    _spawn(registry, 1, 1)
+    tagged = [_spawn(registry, x, -x) for x in (4, 7, 9)]
+    for ent in tagged:
+        ent.components[EntityIdentity] = EntityIdentity(entity_id=0, name="n", archetype="Foe")
+    buf = PositionBuffer.from_registry(registry, (Position, EntityIdentity))
+    assert set(buf.entities) == set(tagged)
+    for ent in tagged:
+        i = buf.index_of(ent)
+        pos = ent.components[Position]
+        assert (buf.xs[i], buf.ys[i]) == (pos.x, pos.y)
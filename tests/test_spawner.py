@@ -1,10 +1,8 @@
 import pytest
-import tcod.ecs
 from engine.spawner import spawn_npc, spawn_item, spawn_container, evaluate_condition, spawn_from_definition
 from engine.ecs.components import EntityIdentity, Position, Attributes, ItemIdentity, CombatVitals, Disposition
 
-def test_evaluate_condition_reputation():
-    registry = tcod.ecs.Registry()
+def test_evaluate_condition_reputation(registry):
     player = registry.new_entity()
     player.components[EntityIdentity] = EntityIdentity(entity_id=1, name="Player", archetype="Standard", is_player=True)
     player.components[Disposition] = Disposition(reputation=-0.5)
@@ -12,9 +10,15 @@ def test_evaluate_condition_reputation():
     assert evaluate_condition(registry, "reputation < 0") is True
     assert evaluate_condition(registry, "reputation > 0") is False
     assert evaluate_condition(registry, "reputation < -0.3") is True
+    # Malformed conditions never block a spawn; unknown variables read as 0.0
+    assert evaluate_condition(registry, "reputation ~ 0") is True
+    assert evaluate_condition(registry, "reputation < lots") is True
+    assert evaluate_condition(registry, "renown == 0") is True
+    # Parsed once, re-read against the live component on each call
+    player.components[Disposition].reputation = 0.5
+    assert evaluate_condition(registry, "reputation < 0") is False
 
-def test_spawn_from_definition_chance():
-    registry = tcod.ecs.Registry()
+def test_spawn_from_definition_chance(registry):
     # Chance 0 should never spawn
     spawn_def = {"type": "item", "id": "weapons/iron_sword", "chance": 0.0}
     result = spawn_from_definition(registry, spawn_def, 5, 5)
@@ -26,8 +30,7 @@ def test_spawn_from_definition_chance():
     assert result is not None
     assert result.components[Position].x == 5
 
-def test_spawn_npc_attributes():
-    registry = tcod.ecs.Registry()
+def test_spawn_npc_attributes(registry):
     npc = spawn_npc(registry, "foe_skirmisher", 10, 10)
     
     assert npc.components[EntityIdentity].name == "Skirmisher"
@@ -36,16 +39,18 @@ def test_spawn_npc_attributes():
     assert npc.components[Attributes].scores["finesse"] == 14
     assert npc.components[CombatVitals].hp == 15
 
-def test_spawn_item_position():
-    registry = tcod.ecs.Registry()
+    # Scores belong to the spawned NPC, not the cached blueprint
+    npc.components[Attributes].scores["finesse"] = 3
+    assert spawn_npc(registry, "foe_skirmisher", 0, 0).components[Attributes].scores["finesse"] == 14
+
+def test_spawn_item_position(registry):
     item = spawn_item(registry, "weapons/iron_sword", 5, 5)
     
     assert item.components[ItemIdentity].entity_id == "iron_sword"
     assert item.components[Position].x == 5
     assert item.components[Position].y == 5
 
-def test_spawn_container_loot():
-    registry = tcod.ecs.Registry()
+def test_spawn_container_loot(registry):
     container = spawn_container(registry, "Loot Crate", 2, 2, ["weapons/iron_sword", "consumables/healing_potion"])
     
     assert container.components[Position].x == 2
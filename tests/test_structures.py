@@ -23,7 +23,7 @@ def test_door_interaction_toggle():
     assert door.components[DoorState].is_open is False
     assert BlocksMovement in door.components
 
-def test_door_destructibility():
+def test_door_destructibility(sim):
     registry = tcod.ecs.Registry()
     door = spawn_door(registry, 1, 1)
     
@@ -32,16 +32,11 @@ def test_door_destructibility():
     
     # Logic in SimulationLoop.apply_damage_ecs should handle death
     # For now we'll just verify the plan's requirement
-    from engine.loop import SimulationLoop
-    from pathlib import Path
-    import tempfile
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        sim = SimulationLoop(chronicle_path=Path(tmpdir)/"chronicle.jsonl")
-        # Re-create door in sim registry
-        door = spawn_door(sim.registry, 1, 1)
-        sim.apply_damage_ecs(door, 100)
-        
-        assert door.components[CombatVitals].is_dead is True
-        # Structural death should remove blocking
-        # Wait, I need to implement that in apply_damage_ecs first.
+    # Re-create door in sim registry
+    door = spawn_door(sim.registry, 1, 1)
+    sim.apply_damage_ecs(door, 100)
+    
+    assert door.components[CombatVitals].is_dead is True
+    # Structural death should remove blocking
+    # Wait, I need to implement that in apply_damage_ecs first.
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from ui.renderer import Renderer
 
@@ -13,8 +14,52 @@ def test_renderer_clear():
     r = Renderer(width=80, height=50)
     # Fill console with some character
     r.root_console.print(0, 0, "@")
-    assert chr(r.root_console.ch[0, 0]) == "@"
+    assert r.glyph_at(0, 0) == ord("@")
     
     # Clear and check
     r.clear()
-    assert chr(r.root_console.ch[0, 0]) == " "
+    assert r.glyph_at(0, 0) == ord(" ")
+    assert np.array_equal(r.snapshot(), np.full((50, 80), ord(" ")))
+
+def test_tile_luts_cover_every_tile_id():
+    from ui.renderer import GLYPH_LUT, FG_LUT, BIOME_COLOR_KEYS
+    from world.generator import TILE_NAMES
+    assert len(GLYPH_LUT) == len(FG_LUT) == len(BIOME_COLOR_KEYS) == len(TILE_NAMES)
+
+def test_draw_cached_text_matches_print():
+    printed = Renderer(width=20, height=5)
+    printed.root_console.print(2, 3, "HP: 9/30", fg=(0, 255, 0))
+
+    cached = Renderer(width=20, height=5)
+    for _ in range(2):
+        cached.draw_cached_text(2, 3, "HP: 9/30", fg=(0, 255, 0))
+    assert len(cached._text_cache) == 1
+    assert np.array_equal(cached.snapshot(), printed.snapshot())
+    assert (cached.root_console.fg == printed.root_console.fg).all()
+
+# BaseState still subclasses tcod's deprecated EventDispatch
+@pytest.mark.filterwarnings("ignore:EventDispatch is no longer maintained:DeprecationWarning")
+def test_engine_skips_frames_until_dirty():
+    from ui.states import BaseState, Engine
+
+    class CountingState(BaseState):
+        renders = 0
+
+        def on_render(self, renderer):
+            CountingState.renders += 1
+
+    class FakeContext:
+        def present(self, console):
+            pass
+
+    engine = Engine(Renderer(width=20, height=10), CountingState)
+    context = FakeContext()
+    assert engine.render_frame(context) is True
+    assert engine.render_frame(context) is False
+    assert CountingState.renders == 1
+
+    engine.renderer.mark_dirty()
+    assert engine.render_frame(context) is True
+    engine.change_state(CountingState(engine))
+    assert engine.render_frame(context) is True
+    assert CountingState.renders == 3
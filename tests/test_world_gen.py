@@ -1,25 +1,16 @@
 import pytest
 import tcod.ecs
 from world.generator import ChunkManager
-from engine.loop import SimulationLoop
 from engine.ecs.components import EntityIdentity, Position, ItemIdentity
-import tempfile
-from pathlib import Path
 
-def test_bespoke_chunk_modular_assembly():
+def test_bespoke_chunk_modular_assembly(bespoke_chunk_finder):
     manager = ChunkManager(world_seed=123)
     
     # Find a bespoke chunk
-    target_chunk = None
-    for y in range(24):
-        for x in range(24):
-            c = manager.get_chunk(x, y)
-            if c["terrain"] == "bespoke":
-                target_chunk = c
-                break
-        if target_chunk: break
-        
-    assert target_chunk is not None
+    settlements = bespoke_chunk_finder(manager, 24)
+    assert settlements
+    target_chunk = manager.get_chunk(*settlements[0])
+    assert target_chunk["terrain"] == "bespoke"
     assert "bespoke_tiles" in target_chunk
     assert "roads" in target_chunk
     
@@ -35,68 +26,88 @@ def test_bespoke_chunk_modular_assembly():
     # Verify roads list is populated
     assert len(target_chunk["roads"]) > 0
 
-def test_bespoke_chunk_multiple_modules():
+def test_bespoke_chunk_multiple_modules(bespoke_chunk_finder):
     # Use a specific seed known to produce limbs
     manager = ChunkManager(world_seed=10101)
     
-    # Force check several chunks to find one with limbs
+    # Check the settlements in order to find one with limbs
     found_limbs = False
-    for y in range(24):
-        for x in range(24):
-            c = manager.get_chunk(x, y)
-            if c["terrain"] == "bespoke":
-                # Check for spawns from limbs
-                # tavern_heart has Innkeeper
-                # small_room has Footlocker
-                # garden_unit has wooden_plank
-                names = [s.get("name", "") for s in c["spawns"]]
-                ids = [s.get("id", "") for s in c["spawns"]]
-                if "Footlocker" in names or "materials/wooden_plank" in ids:
-                    found_limbs = True
-                    break
-        if found_limbs: break
+    for cx, cy in bespoke_chunk_finder(manager, 24):
+        c = manager.get_chunk(cx, cy)
+        # Check for spawns from limbs
+        # tavern_heart has Innkeeper
+        # small_room has Footlocker
+        # garden_unit has wooden_plank
+        names = [s.get("name", "") for s in c["spawns"]]
+        ids = [s.get("id", "") for s in c["spawns"]]
+        if "Footlocker" in names or "materials/wooden_plank" in ids:
+            found_limbs = True
+            break
         
     assert found_limbs is True, "Could not find a settlement with multiple modules using seed 10101"
 
-def test_bespoke_chunk_spawning_integration():
-    with tempfile.TemporaryDirectory() as tmpdir:
-        chronicle_path = Path(tmpdir) / "chronicle.jsonl"
-        sim = SimulationLoop(chronicle_path=chronicle_path)
-        
-        # 1. Setup Player
-        player = sim.registry.new_entity()
-        player.components[EntityIdentity] = EntityIdentity(entity_id=1, name="Player", archetype="Standard", is_player=True)
-        player.components[Position] = Position(x=0, y=0)
-        
-        sim.open_session()
-        
-        # 2. Find a bespoke chunk nearby (search in 8x8 macro region)
-        target_chunk = None
-        for y in range(40):
-            for x in range(40):
-                c = sim.world.get_chunk(x, y)
-                if c["terrain"] == "bespoke":
-                    target_chunk = c
-                    break
-            if target_chunk: break
-            
-        assert target_chunk is not None
-        cx, cy = target_chunk["coords"]
-        gx, gy = cx * 20 + 10, cy * 20 + 10
-        
-        # 3. Teleport player and manually trigger spawner (since move_entity_ecs is 1-tile at a time)
-        from engine.spawner import spawn_bespoke_chunk
-        player.components[Position] = Position(x=gx, y=gy)
-        spawn_bespoke_chunk(sim.registry, target_chunk)
-        
-        # 4. Check for spawned entities
-        found_bespoke = False
-        for ent in sim.registry.Q.all_of(components=[Position]):
-            if ent == player: continue
-            pos = ent.components[Position]
-            if cx * 20 <= pos.x < (cx + 1) * 20 and cy * 20 <= pos.y < (cy + 1) * 20:
-                found_bespoke = True
-                break
-        
-        assert found_bespoke is True
-        sim.close_session()
+def test_bespoke_chunk_spawning_integration(sim, bespoke_chunk_finder):
+    # 1. Setup Player
+    player = sim.registry.new_entity()
+    player.components[EntityIdentity] = EntityIdentity(entity_id=1, name="Player", archetype="Standard", is_player=True)
+    player.components[Position] = Position(x=0, y=0)
+    
+    sim.open_session()
+    
+    # 2. Find a bespoke chunk nearby (search in 8x8 macro region)
+    settlements = bespoke_chunk_finder(sim.world)
+    assert settlements
+    cx, cy = settlements[0]
+    target_chunk = sim.world.get_chunk(cx, cy)
+    assert target_chunk["terrain"] == "bespoke"
+    gx, gy = cx * 20 + 10, cy * 20 + 10
+    
+    # 3. Teleport player and manually trigger spawner (since move_entity_ecs is 1-tile at a time)
+    from engine.spawner import spawn_bespoke_chunk
+    player.components[Position] = Position(x=gx, y=gy)
+    spawn_bespoke_chunk(sim.registry, target_chunk)
+    
+    # 4. Check for spawned entities
+    found_bespoke = False
+    for ent in sim.registry.Q.all_of(components=[Position]):
+        if ent == player: continue
+        pos = ent.components[Position]
+        if cx * 20 <= pos.x < (cx + 1) * 20 and cy * 20 <= pos.y < (cy + 1) * 20:
+            found_bespoke = True
+            break
+    
+    assert found_bespoke is True
+    sim.close_session()
+
+def test_biome_grid_matches_get_biome():
+    world = ChunkManager(world_seed=1234)
+    engine = world.biome_engine
+    grid = engine.get_biome_grid(-10, -5, 40, 30)
+    for y in range(30):
+        for x in range(40):
+            assert engine.biomes[grid[y, x]].id == engine.get_biome(x - 10, y - 5).id
+    assert world.generated_chunks == {}  # scanning generates nothing
+
+def test_tile_block_matches_generated_tiles():
+    from world.generator import TILE_IDS
+    world = ChunkManager(world_seed=1234)
+    # Straddles chunk borders on both axes, including negative chunks
+    block = world.get_tile_block(-25, -7, 50, 30)
+    assert block.shape == (30, 50)
+    for y in range(30):
+        for x in range(50):
+            tile = world._generate_tile(x - 25, y - 7)
+            assert block[y, x] == TILE_IDS[tile] == world.get_tile_id(x - 25, y - 7)
+            assert world.get_tile(x - 25, y - 7) == tile
+
+def test_find_settlements_matches_generated_terrain():
+    from world.territory import TerritoryManager
+    # Territory nodes are one per 8x8 macro-region, so that world is scanned over a wider square
+    for world, size in ((ChunkManager(world_seed=123), 16),
+                        (ChunkManager(world_seed=77, territory=TerritoryManager(world_seed=77)), 40)):
+        found = world.find_settlements(0, 0, size, size)
+        assert found
+        assert world.generated_chunks == {}  # scanning generates nothing
+        assert all(world.get_chunk(x, y)["terrain"] == "bespoke" for x, y in found)
+        generated = [(x, y) for y in range(16) for x in range(16) if world.get_chunk(x, y)["terrain"] == "bespoke"]
+        assert generated == [(x, y) for x, y in found if x < 16 and y < 16]
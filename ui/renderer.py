@@ -8,9 +8,25 @@ Status:      Production-ready for Phase 2.
 """
 
 from __future__ import annotations
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+import numpy as np
 import tcod
 
+if TYPE_CHECKING:
+    # Annotation only; keeps the renderer import free of pydantic and world generation
+    from engine.data_loader import BiomeDef
+
+# Per tile id (world.generator.TILE_IDS): glyph, default colour, and the biome colour key that overrides it
+GLYPH_LUT = np.array([ord(c) for c in ".#.,T~"], dtype=np.int32)
+FG_LUT = np.array(
+    [(50, 50, 50), (120, 120, 120), (70, 70, 70), (40, 140, 40), (20, 100, 20), (20, 40, 150)],
+    dtype=np.uint8,
+)
+BIOME_COLOR_KEYS = ("", "rubble", "", "grass", "tree", "water")
+
+# Upper bound on Renderer.draw_cached_text entries (HP values etc. keep producing new strings)
+TEXT_CACHE_LIMIT = 256
+
 class Renderer:
     """
     Manages the tcod root console and rendering loop.
@@ -22,11 +38,57 @@ class Renderer:
         # Stub: TCOD font loading usually happens here
         self.root_console = tcod.console.Console(width, height)
         self.context: Optional[tcod.context.Context] = None
+        # Reused every frame for the viewport's tile ids
+        self.tile_scratch = np.zeros((height, width), dtype=np.uint8)
+        self._fg_luts: Dict[str, np.ndarray] = {}
+        # Set when the screen needs repainting; cleared by present()
+        self.dirty = True
+        # One-line consoles for repeated HUD text, keyed on (text, fg)
+        self._text_cache: Dict[Tuple[str, Tuple[int, int, int]], tcod.console.Console] = {}
+
+    def mark_dirty(self) -> None:
+        """Requests a repaint on the next frame."""
+        self.dirty = True
+
+    def tile_fg_lut(self, biome: BiomeDef) -> np.ndarray:
+        """FG_LUT with the biome's colour overrides applied, built once per biome id."""
+        lut = self._fg_luts.get(biome.id)
+        if lut is None:
+            lut = FG_LUT.copy()
+            for tile_id, key in enumerate(BIOME_COLOR_KEYS):
+                if key in biome.colors:
+                    lut[tile_id] = biome.colors[key]
+            self._fg_luts[biome.id] = lut
+        return lut
+
+    def draw_cached_text(self, x: int, y: int, text: str, fg: Tuple[int, int, int]) -> None:
+        """
+        print() for text that repeats across frames: the glyphs are laid out once
+        into a side console, then blitted. Cleared when it grows past TEXT_CACHE_LIMIT.
+        """
+        key = (text, fg)
+        cached = self._text_cache.get(key)
+        if cached is None:
+            if len(self._text_cache) >= TEXT_CACHE_LIMIT:
+                self._text_cache.clear()
+            cached = tcod.console.Console(max(len(text), 1), 1)
+            cached.print(0, 0, text, fg=fg)
+            self._text_cache[key] = cached
+        cached.blit(self.root_console, x, y)
 
     def clear(self) -> None:
         """Clear the console with black."""
         self.root_console.clear()
 
+    def glyph_at(self, x: int, y: int) -> int:
+        """Code point at console cell (x, y)."""
+        return int(self.root_console.ch[y, x])
+
+    def snapshot(self) -> np.ndarray:
+        """Copy of the (height, width) glyph array, for whole-screen comparisons."""
+        return self.root_console.ch.copy()
+
     def present(self, context: tcod.context.Context) -> None:
         """Present the current console to the screen."""
         context.present(self.root_console)
+        self.dirty = False
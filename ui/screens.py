@@ -2,14 +2,14 @@
 ZEngine — ui/screens.py
 Implementations of the UI Screen States.
 """
-from typing import Any, List, Optional, Dict, Tuple
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, List, Optional, Dict, Tuple
 import tcod
 from tcod import libtcodpy
 import numpy as np
 
 from ui.states import BaseState, Engine
-from ui.renderer import Renderer
-from engine.loop import SimulationLoop
+from ui.renderer import Renderer, GLYPH_LUT
 from engine.ecs.components import (
     Position, 
     EntityIdentity, 
@@ -26,26 +26,44 @@ from engine.ecs.components import (
     Faction,
     SocialAwareness
 )
-from engine.data_loader import get_entity_def, get_starting_rumors
-from world.generator import Rumor
+
+if TYPE_CHECKING:
+    from engine.loop import SimulationLoop
+
+# (text, row offset from centre, fg); fg None keeps the console default
+_MENU_ITEMS: Tuple[Tuple[str, int, Optional[Tuple[int, int, int]]], ...] = (
+    ("ZEngine MVP", -5, (255, 255, 0)),
+    ("[N]ew Game", 0, None),
+    ("[R]esume Session", 1, None),
+    ("[Q]uit", 2, None),
+)
+_HUD_FOOTER = "[Arrows/WASD] Move   [f] Interact   [i] Inventory   [x] Char Sheet   [c] Craft   [h] History   [ESC] Menu"
+_HUD_FOOTER_FG = (150, 150, 150)
 
 
 class MainMenuState(BaseState):
     """The title screen."""
     
+    def __init__(self, engine: Engine):
+        super().__init__(engine)
+        # The menu never changes, so it is laid out once per console size and blitted
+        self._cached: Optional[tcod.console.Console] = None
+    
     def on_render(self, renderer: Renderer) -> None:
-        renderer.root_console.print(
-            renderer.width // 2, 
-            renderer.height // 2 - 5, 
-            "ZEngine MVP", 
-            fg=(255, 255, 0), 
-            alignment=libtcodpy.CENTER
-        )
-        renderer.root_console.print(renderer.width // 2, renderer.height // 2, "[N]ew Game", alignment=libtcodpy.CENTER)
-        renderer.root_console.print(renderer.width // 2, renderer.height // 2 + 1, "[R]esume Session", alignment=libtcodpy.CENTER)
-        renderer.root_console.print(renderer.width // 2, renderer.height // 2 + 2, "[Q]uit", alignment=libtcodpy.CENTER)
+        cached = self._cached
+        if cached is None or (cached.width, cached.height) != (renderer.width, renderer.height):
+            cached = self._cached = tcod.console.Console(renderer.width, renderer.height)
+            cx, cy = renderer.width // 2, renderer.height // 2
+            for text, dy, fg in _MENU_ITEMS:
+                cached.print(cx, cy + dy, text, fg=fg, alignment=libtcodpy.CENTER)
+        cached.blit(renderer.root_console)
         
     def ev_keydown(self, event: tcod.event.KeyDown) -> None:
+        # Deferred so that importing the screens doesn't load the simulation and data layers
+        from engine.loop import SimulationLoop
+        from engine.data_loader import get_entity_def, get_starting_rumors
+        from world.generator import Rumor
+        
         if event.sym == tcod.event.KeySym.Q:
             self.engine.running = False
         elif event.sym == tcod.event.KeySym.N:
@@ -53,8 +71,10 @@ class MainMenuState(BaseState):
             sim.world.world_seed = 10101
             
             # Setup Rumors
-            for r_def in get_starting_rumors():
-                sim.world.add_rumor(Rumor(r_def.id, r_def.name, r_def.pol_type, r_def.significance))
+            sim.world.add_rumors(
+                Rumor(r_def.id, r_def.name, r_def.pol_type, r_def.significance)
+                for r_def in get_starting_rumors()
+            )
             
             # Setup Player
             hero_def = get_entity_def("hero_standard")
@@ -88,48 +108,43 @@ class ExplorationState(BaseState):
         self.player = None
         
         # Cache player entity reference
-        for ent in self.sim.registry.Q.all_of(components=[EntityIdentity]):
-            if ent.components[EntityIdentity].is_player:
-                self.player = ent
-                break
+        from engine.ecs.systems import get_player
+        self.player = get_player(self.sim.registry)
 
     def on_render(self, renderer: Renderer) -> None:
         """Draws the map and entities with Fog of War (Phase 23)."""
+        # Player components are fetched once per frame
+        player_vitals = self.player.components.get(CombatVitals) if self.player else None
+        player_pos = self.player.components.get(Position) if self.player else None
+        
         # Simple HUD
-        if self.player and CombatVitals in self.player.components:
-            hp = self.player.components[CombatVitals].hp
-            max_hp = self.player.components[CombatVitals].max_hp
-            renderer.root_console.print(1, 1, f"HP: {hp}/{max_hp}", fg=(0, 255, 0))
+        if player_vitals is not None:
+            renderer.draw_cached_text(1, 1, f"HP: {player_vitals.hp}/{player_vitals.max_hp}", fg=(0, 255, 0))
             
         # Party HUD (Phase 22)
         from engine.ecs.components import PartyMember
-        party_members = list(self.sim.registry.Q.all_of(components=[PartyMember, EntityIdentity, CombatVitals]))
-        for i, member in enumerate(party_members):
-            ident = member.components[EntityIdentity]
-            vitals = member.components[CombatVitals]
+        party_members = self.sim.registry.Q.all_of(components=[PartyMember])[EntityIdentity, CombatVitals]
+        for i, (ident, vitals) in enumerate(party_members):
             y = 3 + i
             renderer.root_console.print(1, y, f"{ident.name}: {vitals.hp}/{vitals.max_hp}", fg=(200, 255, 200))
             
-        renderer.root_console.print(1, renderer.height - 2, "[Arrows/WASD] Move   [f] Interact   [i] Inventory   [x] Char Sheet   [c] Craft   [h] History   [ESC] Menu", fg=(150, 150, 150))
+        renderer.draw_cached_text(1, renderer.height - 2, _HUD_FOOTER, fg=_HUD_FOOTER_FG)
         
         # Camera centering based on player
         cam_x, cam_y = 0, 0
         px, py = 0, 0
-        if self.player and Position in self.player.components:
-            px, py = self.player.components[Position].x, self.player.components[Position].y
+        if player_pos is not None:
+            px, py = player_pos.x, player_pos.y
             cam_x = px - renderer.width // 2
             cam_y = py - renderer.height // 2
             
         # 1. Compute FOV (Phase 23)
-        # Build transparency map for current screen
-        transparency = np.ones((renderer.height, renderer.width), dtype=bool)
-        for sy in range(renderer.height):
-            for sx in range(renderer.width):
-                world_x = cam_x + sx
-                world_y = cam_y + sy
-                tile = self.sim.world.get_tile(world_x, world_y)
-                if tile == "wall":
-                    transparency[sy, sx] = False
+        # Tile ids for the whole screen in one pass; only walls block sight
+        from world.generator import TILE_IDS
+        world = self.sim.world
+        width, height = renderer.width, renderer.height
+        tile_ids = world.get_tile_block(cam_x, cam_y, width, height, out=renderer.tile_scratch)
+        transparency = tile_ids != TILE_IDS["wall"]
         
         # Centered FOV
         # Note: with (height, width) array, POV must be (row, col) which is (y, x) relative to screen
@@ -142,70 +157,36 @@ class ExplorationState(BaseState):
         )
         
         # 2. Draw Map and Update Exploration Memory
-        current_chunk = None
-        current_chunk_coords = (-999, -999)
-        
-        for sy in range(renderer.height):
-            world_y = cam_y + sy
-            chunk_y = world_y // self.sim.world.chunk_size
-            
-            for sx in range(renderer.width):
-                world_x = cam_x + sx
-                
-                is_visible = fov[sy, sx]
-                if is_visible:
-                    self.sim.exploration.mark_explored(world_x, world_y)
-                
-                is_explored = self.sim.exploration.is_explored(world_x, world_y)
-                
-                if not is_visible and not is_explored:
-                    continue # Render black
-                
-                # Optimized chunk lookup for biome colors
-                chunk_x = world_x // self.sim.world.chunk_size
-                if (chunk_x, chunk_y) != current_chunk_coords:
-                    current_chunk = self.sim.world.get_chunk(chunk_x, chunk_y)
-                    current_chunk_coords = (chunk_x, chunk_y)
-                
-                tile = self.sim.world.get_tile(world_x, world_y)
-                biome = current_chunk["biome"]
-                b_colors = biome.colors
-                
-                # Default character mapping
-                char, fg = ".", (50, 50, 50)
-                if tile == "wall":
-                    char, fg = "#", tuple(b_colors.get("rubble", [120, 120, 120]))
-                elif tile == "floor":
-                    char, fg = ".", (70, 70, 70)
-                elif tile == "grass":
-                    char, fg = ",", tuple(b_colors.get("grass", [40, 140, 40]))
-                elif tile == "tree":
-                    char, fg = "T", tuple(b_colors.get("tree", [20, 100, 20]))
-                elif tile == "water":
-                    char, fg = "~", tuple(b_colors.get("water", [20, 40, 150]))
-                
-                # Apply Dimming if not visible
-                if not is_visible:
-                    # Explored but not visible -> Darken
-                    fg = tuple(int(c * 0.3) for c in fg)
-                
-                renderer.root_console.print(sx, sy, char, fg=fg)
-        
-        # 3. Draw entities (Only if visible)
-        for ent in self.sim.registry.Q.all_of(components=[Position, EntityIdentity]):
-            pos = ent.components[Position]
-            ident = ent.components[EntityIdentity]
-                
+        self.sim.exploration.mark_explored_block(cam_x, cam_y, fov)
+        shown = fov | self.sim.exploration.explored_block(cam_x, cam_y, width, height)
+        
+        # Biome colours are per chunk, so colour each chunk's slice of the screen with its own LUT
+        fg = np.empty((height, width, 3), dtype=np.uint8)
+        for chunk_x, chunk_y, block, _ in world.chunk_spans(cam_x, cam_y, width, height):
+            fg[block] = renderer.tile_fg_lut(world.get_chunk(chunk_x, chunk_y)["biome"])[tile_ids[block]]
+        
+        # Explored but not visible -> Darken
+        dimmed = ~fov
+        fg[dimmed] = (fg[dimmed] * 0.3).astype(np.uint8)
+        
+        # Unexplored cells stay black
+        renderer.root_console.ch[shown] = GLYPH_LUT[tile_ids[shown]]
+        renderer.root_console.fg[shown] = fg[shown]
+        
+        # 3. Draw entities (Only if visible); the player always shows, drawn last so it stays on top
+        from engine.ecs.systems import PLAYER_TAG
+        registry = self.sim.registry
+        others = registry.Q.all_of(components=[Position, EntityIdentity]).none_of(tags=[PLAYER_TAG])
+        for pos, ident in others[Position, EntityIdentity]:
             screen_x = pos.x - cam_x
             screen_y = pos.y - cam_y
             
-            if 0 <= screen_x < renderer.width and 0 <= screen_y < renderer.height:
-                if fov[screen_y, screen_x] or ident.is_player:
-                    if ident.is_player:
-                        renderer.root_console.print(screen_x, screen_y, "@", fg=(0, 255, 255))
-                    else:
-                        char = ident.archetype[0] if ident.archetype else "e"
-                        renderer.root_console.print(screen_x, screen_y, char, fg=(255, 50, 50))
+            if 0 <= screen_x < width and 0 <= screen_y < height and fov[screen_y, screen_x]:
+                char = ident.archetype[0] if ident.archetype else "e"
+                renderer.root_console.print(screen_x, screen_y, char, fg=(255, 50, 50))
+                
+        if player_pos is not None and 0 <= px - cam_x < width and 0 <= py - cam_y < height:
+            renderer.root_console.print(px - cam_x, py - cam_y, "@", fg=(0, 255, 255))
 
 
     def ev_keydown(self, event: tcod.event.KeyDown) -> None:
@@ -757,6 +738,7 @@ class ChronicleUIState(BaseState):
         from engine.chronicle import ChronicleReader
         from engine.narrative import NarrativeGenerator
         
+        self.sim.inscriber.flush()  # async mode: make queued entries readable
         reader = ChronicleReader(self.sim.inscriber.chronicle_path)
         # Filter for significance >= 3 (Notable+)
         entries = reader.by_significance(minimum=3)
@@ -35,6 +35,16 @@ class Engine:
     def change_state(self, new_state: BaseState) -> None:
         """Transitions to a new Active State."""
         self.active_state = new_state
+        self.renderer.mark_dirty()
+
+    def render_frame(self, context: tcod.context.Context) -> bool:
+        """Redraws and presents the active state if the renderer is dirty. Returns whether it did."""
+        if not self.renderer.dirty:
+            return False
+        self.renderer.clear()
+        self.active_state.on_render(self.renderer)
+        self.renderer.present(context)
+        return True
 
     def run(self) -> None:
         """Main blocking event loop."""
@@ -48,10 +58,8 @@ class Engine:
             self.renderer.context = context
             
             while self.running:
-                # 1. Render
-                self.renderer.clear()
-                self.active_state.on_render(self.renderer)
-                self.renderer.present(context)
+                # 1. Render (skipped while nothing has changed, e.g. after mouse motion)
+                self.render_frame(context)
                 
                 # 2. Handle Inputs
                 for event in tcod.event.wait():
@@ -63,3 +71,7 @@ class Engine:
                         
                     # Route to active state handler
                     self.active_state.dispatch(event)
+                    
+                    # States only react to key presses; window events need a re-present
+                    if isinstance(event, (tcod.event.KeyDown, tcod.event.WindowEvent)):
+                        self.renderer.mark_dirty()
@@ -4,34 +4,145 @@ ExplorationManager: Persistent visibility and Fog of War for Phase 23.
 Tracks seen tiles across an infinite world.
 """
 
-from typing import Set, Tuple, List, Dict, Any
+import base64
+import binascii
+from typing import Iterator, Set, Tuple, List, Dict, Any
+
+import numpy as np
+
+_MASK32 = 0xFFFFFFFF
+# Edge length, in tiles, of the dense blocks mirroring explored_tiles for explored_block()
+_BLOCK = 64
+
+
+def _pack(x: int, y: int) -> int:
+    """Packs a world coordinate into one int (x in the high 32 bits, y in the low)."""
+    return ((x & _MASK32) << 32) | (y & _MASK32)
+
+
+def _unpack(key: int) -> Tuple[int, int]:
+    """Inverse of _pack; sign-extends both halves."""
+    x, y = key >> 32, key & _MASK32
+    if x & 0x80000000:
+        x -= 1 << 32
+    if y & 0x80000000:
+        y -= 1 << 32
+    return x, y
+
+
+def _pack_block(x0: int, y0: int, width: int, height: int) -> np.ndarray:
+    """_pack over a world rectangle: (height, width) uint64 array of keys."""
+    xs = (np.arange(x0, x0 + width, dtype=np.int64) & _MASK32).astype(np.uint64) << np.uint64(32)
+    ys = (np.arange(y0, y0 + height, dtype=np.int64) & _MASK32).astype(np.uint64)
+    return ys[:, None] | xs[None, :]
+
+
+def _block_spans(x0: int, y0: int, width: int, height: int) -> Iterator[Tuple[Tuple[int, int], Tuple[slice, slice], Tuple[slice, slice]]]:
+    """
+    Splits a world rectangle along _BLOCK borders. Yields (block_key, rect_slices,
+    local_slices): rect_slices index a (height, width) array, local_slices the block.
+    """
+    for by in range(y0 // _BLOCK, (y0 + height - 1) // _BLOCK + 1):
+        top, bottom = max(y0, by * _BLOCK), min(y0 + height, (by + 1) * _BLOCK)
+        for bx in range(x0 // _BLOCK, (x0 + width - 1) // _BLOCK + 1):
+            left, right = max(x0, bx * _BLOCK), min(x0 + width, (bx + 1) * _BLOCK)
+            yield ((bx, by),
+                   (slice(top - y0, bottom - y0), slice(left - x0, right - x0)),
+                   (slice(top - by * _BLOCK, bottom - by * _BLOCK), slice(left - bx * _BLOCK, right - bx * _BLOCK)))
+
 
 class ExplorationManager:
     def __init__(self):
-        # A set of (world_x, world_y) coordinates that have been explored.
-        self.explored_tiles: Set[Tuple[int, int]] = set()
+        # Explored (world_x, world_y) coordinates, packed via _pack so the
+        # per-tile FOV checks hash a single int instead of building a tuple.
+        self.explored_tiles: Set[int] = set()
+        # Dense bool mirror of explored_tiles in _BLOCK x _BLOCK blocks, so explored_block()
+        # slices arrays instead of probing the set per cell. _synced_with records the
+        # (set identity, size) it matches; the tiles only ever grow, so any outside change
+        # (load_state, direct edits) shows up there and triggers a rebuild.
+        self._blocks: Dict[Tuple[int, int], np.ndarray] = {}
+        self._synced_with: Tuple[int, int] = (id(self.explored_tiles), 0)
+
+    def _in_sync(self) -> bool:
+        return self._synced_with == (id(self.explored_tiles), len(self.explored_tiles))
+
+    def _block(self, key: Tuple[int, int]) -> np.ndarray:
+        grid = self._blocks.get(key)
+        if grid is None:
+            grid = self._blocks[key] = np.zeros((_BLOCK, _BLOCK), dtype=bool)
+        return grid
+
+    def _sync_blocks(self) -> None:
+        """Rebuilds the block mirror from explored_tiles if it has drifted."""
+        if self._in_sync():
+            return
+        self._blocks = {}
+        keys = np.fromiter(self.explored_tiles, dtype=np.uint64, count=len(self.explored_tiles))
+        # Undo _pack: both halves are two's-complement int32
+        xs = (keys >> np.uint64(32)).astype(np.uint32).view(np.int32).astype(np.int64)
+        ys = (keys & np.uint64(_MASK32)).astype(np.uint32).view(np.int32).astype(np.int64)
+        bxs, bys = xs // _BLOCK, ys // _BLOCK
+        for bx, by in set(zip(bxs.tolist(), bys.tolist())):
+            sel = (bxs == bx) & (bys == by)
+            self._block((bx, by))[ys[sel] - by * _BLOCK, xs[sel] - bx * _BLOCK] = True
+        self._synced_with = (id(self.explored_tiles), len(self.explored_tiles))
 
     def mark_explored(self, x: int, y: int) -> None:
         """Marks a specific world coordinate as explored."""
-        self.explored_tiles.add((x, y))
+        in_sync = self._in_sync()
+        self.explored_tiles.add(_pack(x, y))
+        if in_sync:
+            self._block((x // _BLOCK, y // _BLOCK))[y % _BLOCK, x % _BLOCK] = True
+            self._synced_with = (id(self.explored_tiles), len(self.explored_tiles))
 
     def is_explored(self, x: int, y: int) -> bool:
         """Returns True if the coordinate has been explored."""
-        return (x, y) in self.explored_tiles
+        return _pack(x, y) in self.explored_tiles
+
+    def mark_explored_block(self, x0: int, y0: int, mask: np.ndarray) -> None:
+        """Marks every True cell of a (height, width) mask whose top-left sits at (x0, y0)."""
+        height, width = mask.shape
+        in_sync = self._in_sync()
+        self.explored_tiles.update(_pack_block(x0, y0, width, height)[mask].tolist())
+        if in_sync:
+            for key, rect, local in _block_spans(x0, y0, width, height):
+                if mask[rect].any():
+                    self._block(key)[local] |= mask[rect]
+            self._synced_with = (id(self.explored_tiles), len(self.explored_tiles))
+
+    def explored_block(self, x0: int, y0: int, width: int, height: int) -> np.ndarray:
+        """Bulk is_explored: (height, width) bool mask for the rectangle at (x0, y0)."""
+        self._sync_blocks()
+        out = np.zeros((height, width), dtype=bool)
+        for key, rect, local in _block_spans(x0, y0, width, height):
+            grid = self._blocks.get(key)
+            if grid is not None:
+                out[rect] = grid[local]
+        return out
 
     def get_state(self) -> Dict[str, Any]:
         """Returns serializable state for snapshots."""
-        # Convert set of tuples to list of strings "x_y" for JSON efficiency
+        # Packed keys as one little-endian uint64 blob, base64'd to stay JSON-safe
+        blob = np.fromiter(self.explored_tiles, dtype="<u8", count=len(self.explored_tiles)).tobytes()
         return {
-            "tiles": [f"{x}_{y}" for x, y in self.explored_tiles]
+            "tiles_bin": base64.b64encode(blob).decode("ascii")
         }
 
     def load_state(self, data: Dict[str, Any]) -> None:
         """Restores state from serializable data."""
         self.explored_tiles = set()
+        if "tiles_bin" in data:
+            try:
+                raw = base64.b64decode(data["tiles_bin"], validate=True)
+                self.explored_tiles = set(np.frombuffer(raw, dtype="<u8").tolist())
+            except (ValueError, TypeError, binascii.Error):
+                pass
+            return
+
+        # Legacy snapshots: list of "x_y" strings
         for tile_str in data.get("tiles", []):
             try:
                 x, y = map(int, tile_str.split("_"))
-                self.explored_tiles.add((x, y))
+                self.explored_tiles.add(_pack(x, y))
             except (ValueError, AttributeError):
                 continue
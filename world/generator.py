@@ -9,11 +9,17 @@ Status:      Production-ready for Phase 11.
 
 from __future__ import annotations
 import random
+import numpy as np
 import tcod.noise
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterable, List, Optional, Tuple, Any
 from engine.data_loader import get_biome_defs, BiomeDef, get_module_defs, ModuleDef
 
+# Dense ids for every terrain string a chunk can contain (see ChunkManager.get_chunk_tiles).
+# Id 0 is reserved so a zeroed grid never reads as real terrain.
+TILE_NAMES: Tuple[str, ...] = ("", "wall", "floor", "grass", "tree", "water")
+TILE_IDS: Dict[str, int] = {name: i for i, name in enumerate(TILE_NAMES) if name}
+
 class SettlementPlanner:
     """
     Assembles settlements from modular components.
@@ -117,10 +123,29 @@ class WorldBiomeEngine:
             
         return self.biomes[0] # Total fallback
 
-@dataclass(frozen=True)
-class ChunkKey:
-    x: int
-    y: int
+    def get_biome_grid(self, x0: int, y0: int, width: int, height: int) -> np.ndarray:
+        """
+        Vectorized get_biome over a chunk rectangle.
+        Returns an int16 (height, width) array of indices into self.biomes.
+        """
+        scale = 0.05
+        ys, xs = np.mgrid[y0:y0 + height, x0:x0 + width]
+        # Same float32 samples as get_point, widened before the range math
+        t_val = (self.temp_noise[xs * scale, ys * scale].astype(np.float64) + 1.0) / 2.0
+        h_val = (self.hum_noise[xs * scale, ys * scale].astype(np.float64) + 1.0) / 2.0
+
+        fallback = next((i for i, b in enumerate(self.biomes) if b.id == "plains"), 0)
+        grid = np.full((height, width), fallback, dtype=np.int16)
+        unassigned = np.ones((height, width), dtype=bool)
+        # First matching biome wins, as in get_biome
+        for i, b in enumerate(self.biomes):
+            if b.id == "plains": continue
+            hit = (unassigned
+                   & (b.temp_range[0] <= t_val) & (t_val <= b.temp_range[1])
+                   & (b.hum_range[0] <= h_val) & (h_val <= b.hum_range[1]))
+            grid[hit] = i
+            unassigned &= ~hit
+        return grid
 
 @dataclass
 class Rumor:
@@ -270,7 +295,7 @@ class ChunkManager:
         self.world_seed = world_seed
         self.chunk_size = chunk_size
         self.territory = territory
-        self.generated_chunks: Dict[ChunkKey, Dict[str, Any]] = {}
+        self.generated_chunks: Dict[Tuple[int, int], Dict[str, Any]] = {}
         self.rumor_queue: List[Rumor] = []
         self.bespoke_templates = [
             "cracked_spire", "wayfarers_hearth", "lithic_circle", 
@@ -283,6 +308,14 @@ class ChunkManager:
         """Add a pending point of light to the resolution queue."""
         self.rumor_queue.append(rumor)
 
+    def add_rumors(self, rumors: Iterable[Rumor]):
+        """
+        Bulk add_rumor. Orders the queue once, so the per-pop significance
+        sorts below run over already-sorted data.
+        """
+        self.rumor_queue.extend(rumors)
+        self.rumor_queue.sort(key=lambda r: r.significance, reverse=True)
+
     def get_next_rumor(self) -> Optional[Rumor]:
         """Pops the next available rumor from the queue."""
         if not self.rumor_queue:
@@ -293,10 +326,109 @@ class ChunkManager:
 
     def get_chunk(self, chunk_x: int, chunk_y: int) -> Dict[str, Any]:
         """Retrieve or generate a chunk at the given coordinates."""
-        key = ChunkKey(chunk_x, chunk_y)
-        if key not in self.generated_chunks:
-            self.generated_chunks[key] = self._generate_chunk(chunk_x, chunk_y)
-        return self.generated_chunks[key]
+        # Plain tuple keys hash in C; a frozen dataclass key hashed in Python
+        key = (chunk_x, chunk_y)
+        chunk = self.generated_chunks.get(key)
+        if chunk is None:
+            chunk = self.generated_chunks[key] = self._generate_chunk(chunk_x, chunk_y)
+        return chunk
+
+    def find_biome(self, biome_id: str, x0: int, y0: int, width: int, height: int) -> Optional[Tuple[int, int]]:
+        """
+        First chunk (row-major) in the rectangle whose biome is biome_id, or None.
+        Reads the noise directly, so nothing is generated.
+        """
+        engine = self.biome_engine
+        idx = next((i for i, b in enumerate(engine.biomes) if b.id == biome_id), None)
+        if idx is None:
+            return None
+        hits = np.argwhere(engine.get_biome_grid(x0, y0, width, height) == idx)
+        if len(hits) == 0:
+            return None
+        y, x = hits[0]
+        return x0 + int(x), y0 + int(y)
+
+    def get_chunk_tiles(self, chunk_x: int, chunk_y: int) -> np.ndarray:
+        """
+        (chunk_size, chunk_size) uint8 grid of TILE_IDS for one chunk, indexed
+        [local_y, local_x]. Built on first access and kept on the chunk dict;
+        chunk terrain never changes after generation.
+        """
+        chunk = self.get_chunk(chunk_x, chunk_y)
+        tiles = chunk.get("tile_ids")
+        if tiles is None:
+            size = self.chunk_size
+            x0, y0 = chunk_x * size, chunk_y * size
+            tiles = np.array(
+                [[TILE_IDS[self._generate_tile(x0 + lx, y0 + ly)] for lx in range(size)] for ly in range(size)],
+                dtype=np.uint8,
+            )
+            chunk["tile_ids"] = tiles
+        return tiles
+
+    def chunk_spans(self, x0: int, y0: int, width: int, height: int) -> Iterable[Tuple[int, int, Tuple[slice, slice], Tuple[slice, slice]]]:
+        """
+        Splits a world rectangle along chunk borders. Yields
+        (chunk_x, chunk_y, block_slices, local_slices), where block_slices index
+        a (height, width) array for the rectangle and local_slices index the chunk.
+        """
+        size = self.chunk_size
+        for chunk_y in range(y0 // size, (y0 + height - 1) // size + 1):
+            top = max(y0, chunk_y * size)
+            bottom = min(y0 + height, (chunk_y + 1) * size)
+            for chunk_x in range(x0 // size, (x0 + width - 1) // size + 1):
+                left = max(x0, chunk_x * size)
+                right = min(x0 + width, (chunk_x + 1) * size)
+                block = (slice(top - y0, bottom - y0), slice(left - x0, right - x0))
+                local = (slice(top - chunk_y * size, bottom - chunk_y * size),
+                         slice(left - chunk_x * size, right - chunk_x * size))
+                yield chunk_x, chunk_y, block, local
+
+    def get_tile_block(self, x0: int, y0: int, width: int, height: int,
+                       out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Bulk get_tile: (height, width) uint8 grid of TILE_IDS for the world
+        rectangle at (x0, y0). Fills out in place when given.
+        """
+        if out is None:
+            out = np.empty((height, width), dtype=np.uint8)
+        for chunk_x, chunk_y, block, local in self.chunk_spans(x0, y0, width, height):
+            out[block] = self.get_chunk_tiles(chunk_x, chunk_y)[local]
+        return out
+
+    def _poi_at(self, x: int, y: int) -> Tuple[Optional[TerritoryNode], List[Tuple[int, int]], Optional[str]]:
+        """
+        Point-of-light lookup for one chunk: (territory_node, poi_chunks, poi_type).
+        poi_type is None for ordinary chunks. poi_chunks is only filled by the
+        legacy fallback used without a territory manager.
+        """
+        if self.territory:
+            territory_node = self.territory.get_node_at(x, y)
+            return territory_node, [], territory_node.poi_type if territory_node else None
+            
+        # For legacy compatibility or testing without territory manager, fallback to stochastic
+        poi_chunks = []
+        region_x = x // 4
+        region_y = y // 4
+        region_rng = random.Random(hash((region_x, region_y, self.world_seed)))
+        poi_count = region_rng.randint(1, 2)
+        for _ in range(poi_count):
+            lx = region_rng.randint(0, 3)
+            ly = region_rng.randint(0, 3)
+            poi_chunks.append((region_x * 4 + lx, region_y * 4 + ly))
+        return None, poi_chunks, "settlement" if (x, y) in poi_chunks else None
+
+    def find_settlements(self, x0: int, y0: int, width: int, height: int) -> List[Tuple[int, int]]:
+        """
+        Chunks (row-major) in the rectangle that generate as bespoke settlements.
+        Reads the territory graph directly, so nothing is generated.
+        """
+        return [
+            (x, y)
+            for y in range(y0, y0 + height)
+            for x in range(x0, x0 + width)
+            if self._poi_at(x, y)[2] == "settlement"
+        ]
 
     def _generate_chunk(self, x: int, y: int) -> Dict[str, Any]:
         """
@@ -333,28 +465,9 @@ class ChunkManager:
             chunk_data["faction_id"] = f"warband_{x}_{y}"
             
         # 1. Regional Blueprint (Points of Light via Territory Graph)
-        territory_node = None
-        if self.territory:
-            territory_node = self.territory.get_node_at(x, y)
-            
-        # For legacy compatibility or testing without territory manager, fallback to stochastic
-        poi_chunks = []
-        if not self.territory:
-            region_x = x // 4
-            region_y = y // 4
-            region_rng = random.Random(hash((region_x, region_y, self.world_seed)))
-            poi_count = region_rng.randint(1, 2)
-            for _ in range(poi_count):
-                lx = region_rng.randint(0, 3)
-                ly = region_rng.randint(0, 3)
-                poi_chunks.append((region_x * 4 + lx, region_y * 4 + ly))
-        
-        is_poi = territory_node is not None or (not self.territory and (x, y) in poi_chunks)
-            
-        if is_poi:
-            # Determine type
-            poi_type = territory_node.poi_type if territory_node else "settlement"
+        territory_node, poi_chunks, poi_type = self._poi_at(x, y)
             
+        if poi_type is not None:
             if poi_type == "settlement":
                 chunk_data["terrain"] = "bespoke"
                 if territory_node:
@@ -479,6 +592,15 @@ class ChunkManager:
 
     def get_tile(self, global_x: int, global_y: int) -> str:
         """Returns the specific string terrain type for a given coordinate."""
+        return TILE_NAMES[self.get_tile_id(global_x, global_y)]
+
+    def get_tile_id(self, global_x: int, global_y: int) -> int:
+        """TILE_IDS value at a world coordinate, read from the chunk's cached tile grid."""
+        size = self.chunk_size
+        return int(self.get_chunk_tiles(global_x // size, global_y // size)[global_y % size, global_x % size])
+
+    def _generate_tile(self, global_x: int, global_y: int) -> str:
+        """Derives the terrain at a coordinate from the chunk data; get_chunk_tiles caches the result."""
         chunk_x = global_x // self.chunk_size
         chunk_y = global_y // self.chunk_size
         chunk = self.get_chunk(chunk_x, chunk_y)